@@ -1,28 +1,37 @@
-import datetime
+import hashlib
 import json
 import argparse
+import operator
 import os
-from bedrock_agents_sdk import BedrockAgents, Agent, Message, SecurityPlugin, GuardrailPlugin, KnowledgeBasePlugin
+import threading
+import time
+from bedrock_agents_sdk import BedrockAgents, Agent
+
+# Supported operations for add_two_numbers; unknown operations fall back to add
+_OPERATIONS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul
+}
+
+# save_note can run concurrently with other tool calls; serialise the writes
+_NOTE_LOCK = threading.Lock()
 
 # Define functions (no decorators needed)
 def get_time() -> dict:
     """Get the current time with timezone information"""
-    now = datetime.datetime.now()
-    current_time = now.strftime("%H:%M:%S")
-    timezone = datetime.datetime.now().astimezone().tzname()
+    now = time.localtime()
     return {
-        "time": current_time,
-        "timezone": timezone
+        "time": f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}",
+        "timezone": now.tm_zone
     }
 
 def get_date() -> dict:
     """Get the current date with timezone information"""
-    now = datetime.datetime.now()
-    current_date = now.strftime("%Y-%m-%d")
-    timezone = datetime.datetime.now().astimezone().tzname()
+    now = time.localtime()
     return {
-        "date": current_date,
-        "timezone": timezone
+        "date": f"{now.tm_year:04d}-{now.tm_mon:02d}-{now.tm_mday:02d}",
+        "timezone": now.tm_zone
     }
 
 def add_two_numbers(a: int, b: int, operation: str = "add") -> dict:
@@ -34,13 +43,7 @@ def add_two_numbers(a: int, b: int, operation: str = "add") -> dict:
     :param operation: The operation to perform (must be one of: "add", "subtract", "multiply")
     :return: Dictionary containing the result of the operation
     """
-    if operation == "add":
-        return {"result": a + b}
-    if operation == "subtract":
-        return {"result": a - b}
-    elif operation == "multiply":
-        return {"result": a * b}
-    return {"result": a + b}
+    return {"result": _OPERATIONS.get(operation, operator.add)(a, b)}
 
 def save_note(content: str, filename: str = "note.txt") -> dict:
     """
@@ -51,8 +54,9 @@ def save_note(content: str, filename: str = "note.txt") -> dict:
     :return: Dictionary containing the result of the operation
     """
     try:
-        with open(filename, "w") as f:
-            f.write(content)
+        with _NOTE_LOCK:
+            with open(filename, "w") as f:
+                f.write(content)
         return {
             "success": True,
             "message": f"Note saved to {filename}",
@@ -64,7 +68,63 @@ def save_note(content: str, filename: str = "note.txt") -> dict:
             "message": f"Error saving note: {str(e)}"
         }
 
-def main():
+# Agent instructions and action groups are fixed for the lifetime of the process.
+# Keeping them as constants (with action groups in a stable, sorted order) means
+# every invocation sends a byte-identical instruction and tool-schema prefix.
+_INSTRUCTIONS = """You are a helpful and friendly assistant helping to test this new agent.
+When asked about time or date, use the appropriate function to get accurate information.
+When asked to perform calculations, use the add_two_numbers function with the appropriate operation.
+You can save notes using the save_note function.
+If provided with files, you can analyze them and explain their contents.
+Always explain your reasoning before taking actions."""
+
+_FUNCTIONS = {
+    "MathActions": [add_two_numbers],
+    "NoteActions": [save_note],
+    "TimeActions": [get_date, get_time]
+}
+
+def _cache_key(agent: Agent, messages: list) -> str:
+    """Build a stable cache key from the agent configuration and the conversation"""
+    payload = json.dumps({
+        "model": agent.model,
+        "instructions": agent.instructions,
+        "functions": sorted(f.name for f in agent.functions),
+        "code_interpreter": agent.enable_code_interpreter,
+        # Attached files change the answer, so each is identified by name and content
+        "files": [[f.name, hashlib.sha256(f.content).hexdigest()] for f in agent.files],
+        "messages": messages
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def run_cached(client: BedrockAgents, agent: Agent, messages: list, cache_dir: str) -> dict:
+    """
+    Run the agent, replaying a previously stored response for identical inputs.
+    
+    Only text responses are cached; runs that produce files always go to Bedrock.
+    
+    :param client: The Bedrock Agents client
+    :param agent: The agent to run
+    :param messages: The conversation to send
+    :param cache_dir: Directory holding the cached responses
+    :return: The result of the run
+    """
+    path = os.path.join(cache_dir, _cache_key(agent, messages) + ".json")
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+    
+    result = client.run(agent=agent, messages=messages)
+    if not result.get("files"):
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"response": result["response"], "files": []}, f)
+    return result
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for the example"""
     parser = argparse.ArgumentParser(description="Amazon Bedrock Agents SDK Example")
     parser.add_argument("--chat", action="store_true", help="Start in interactive chat mode")
     parser.add_argument("--region", type=str, help="AWS region name")
@@ -76,41 +136,48 @@ def main():
                         choices=["none", "minimal", "standard", "detailed", "raw"],
                         help="Agent trace level (raw shows complete unprocessed trace data)")
     parser.add_argument("--file", type=str, help="Path to a file to send to the agent")
+    parser.add_argument("--query", type=str, action="append",
+                        help="Query to send to the agent (repeat to run several queries concurrently)")
     parser.add_argument("--kms-key", type=str, help="Customer KMS key ARN for encryption")
-    args = parser.parse_args()
+    parser.add_argument("--latency-optimized", action="store_true",
+                        help="Use latency-optimized inference (supported models and regions only)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Replay cached responses for repeated queries instead of calling Bedrock")
+    parser.add_argument("--cache-dir", type=str, default=os.path.expanduser("~/.cache/bedrock_agents_demo"),
+                        help="Directory for cached responses (used with --cache)")
+    return parser
+
+def main(argv=None):
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.cache and args.query and len(args.query) > 1:
+        parser.error("--cache can only be used with a single --query")
     
     # Create the client with specified options
     client = BedrockAgents(
         region_name=args.region,
         profile_name=args.profile,
         verbosity=args.verbosity,
-        trace_level=args.trace
+        trace_level=args.trace,
+        performance_config={"latency": "optimized"} if args.latency_optimized else None
     )
     
-    # Register plugins if needed
-    if args.kms_key:
-        client.register_plugin(SecurityPlugin(customer_encryption_key_arn=args.kms_key))
-    
     # Create the agent with functions directly in the definition
     agent = Agent(
         name="HelperAgent",
         model="us.anthropic.claude-3-5-sonnet-20241022-v2:0",
-        instructions="""You are a helpful and friendly assistant helping to test this new agent.
-        When asked about time or date, use the appropriate function to get accurate information.
-        When asked to perform calculations, use the add_two_numbers function with the appropriate operation.
-        You can save notes using the save_note function.
-        If provided with files, you can analyze them and explain their contents.
-        Always explain your reasoning before taking actions.""",
-        functions={
-            "TimeActions": [get_time, get_date],
-            "MathActions": [add_two_numbers],
-            "NoteActions": [save_note]
-        },
+        instructions=_INSTRUCTIONS,
+        functions=_FUNCTIONS,
         enable_code_interpreter=True  # Enable code interpreter for file analysis
     )
     
+    # Register plugins if needed
+    if args.kms_key:
+        from bedrock_agents_sdk import SecurityPlugin
+        agent.add_plugin(SecurityPlugin(customer_encryption_key_arn=args.kms_key))
+    
     # Add a file if specified
-    if args.file and os.path.exists(args.file):
+    if args.file:
         try:
             agent.add_file_from_path(args.file)
             print(f"Added file: {args.file}")
@@ -121,33 +188,34 @@ def main():
     if args.chat:
         client.chat(agent=agent)
     else:
-        # Test with a query that will trigger function calling
-        result = client.run(
-            agent=agent,
-            messages=[
-                {
-                    "role": "user",
-                    "content": "What time is it now, and can you also add 25 and 17 for me?"
-                }
-            ]
-        )
+        # Test with a query that will trigger function calling unless queries were given
+        queries = args.query or ["What time is it now, and can you also add 25 and 17 for me?"]
+        message_lists = [[{"role": "user", "content": query}] for query in queries]
         
-        print("\nFinal response from agent:")
-        print("-" * 50)
-        print(result["response"])
-        print("-" * 50)
+        if len(message_lists) > 1:
+            results = client.run_batch(agent=agent, message_lists=message_lists)
+        elif args.cache:
+            results = [run_cached(client, agent, message_lists[0], args.cache_dir)]
+        else:
+            results = [client.run(agent=agent, messages=message_lists[0])]
         
-        # Handle any files returned by the agent
-        if result.get("files"):
-            print(f"\nThe agent generated {len(result['files'])} file(s):")
-            for i, file in enumerate(result["files"]):
-                print(f"  {i+1}. {file.name} ({len(file.content)} bytes, type: {file.type})")
+        for query, result in zip(queries, results):
+            if len(queries) > 1:
+                print(f"\nQuery: {query}")
+            print("\nFinal response from agent:")
+            print("-" * 50)
+            print(result["response"])
+            print("-" * 50)
             
-            # Save the files
-            save_dir = "output"
-            os.makedirs(save_dir, exist_ok=True)
-            saved_paths = result["save_all_files"](save_dir)
-            print(f"\nFiles saved to: {', '.join(saved_paths)}")
+            # Handle any files returned by the agent
+            if result.get("files"):
+                print(f"\nThe agent generated {len(result['files'])} file(s):")
+                for i, file in enumerate(result["files"]):
+                    print(f"  {i+1}. {file.name} ({len(file.content)} bytes, type: {file.type})")
+                
+                # Save the files
+                saved_paths = result["save_all_files"]("output")
+                print(f"\nFiles saved to: {', '.join(saved_paths)}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,29 +1,129 @@
 """
 Main client for Bedrock Agents SDK.
 """
-import boto3
-import json
+import asyncio
+import codecs
+import copy
+import functools
+import inspect
+import os
+import threading
 import uuid
-from typing import List, Dict, Any, Optional, Union, Callable
-from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, TextIO, Union, Callable, TYPE_CHECKING
 
 from bedrock_agents_sdk.models.agent import Agent
 from bedrock_agents_sdk.models.function import Function
 from bedrock_agents_sdk.models.message import Message
 from bedrock_agents_sdk.models.files import OutputFile
-from bedrock_agents_sdk.utils.parameter_extraction import extract_parameter_info
+from bedrock_agents_sdk.plugins.base import AgentPlugin
+from bedrock_agents_sdk.utils.serialization import serialize_result
 from bedrock_agents_sdk.utils.parameter_conversion import convert_parameters
 from bedrock_agents_sdk.utils.trace_processing import process_trace_data
 
+# boto3 and botocore take most of the time needed to import the SDK, so they are
+# only imported when a runtime client is first needed
+if TYPE_CHECKING:
+    from botocore.config import Config
+
+# Connection settings for the Bedrock runtime client. The pool is sized so that
+# concurrent runs and parallel tool calls don't wait on each other for a connection,
+# and keep-alive lets follow-up invocations reuse the warm TLS connection. Agent
+# turns (especially with code interpreter) can stream for well over a minute, so
+# the read timeout is longer than botocore's default.
+DEFAULT_BOTO_OPTIONS = {
+    "max_pool_connections": 50,
+    "tcp_keepalive": True,
+    "retries": {"max_attempts": 3, "mode": "adaptive"},
+    "connect_timeout": 10,
+    "read_timeout": 120
+}
+
+# Held while creating runtime clients, so concurrent first uses share one client
+_RUNTIME_CLIENT_LOCK = threading.Lock()
+
+class _ConfigKey:
+    """
+    Cache key for a botocore Config
+    
+    Configs hash by identity, so equal configs created separately (for example one
+    per request) would each get their own runtime client. The key compares the
+    options the config was created with instead.
+    
+    Those options are read from botocore's private Config._user_provided_options
+    (the attribute Config.merge uses). If a botocore release removes it, the key
+    falls back to the config's identity, so clients are no longer shared between
+    separately created configs but are still created normally.
+    """
+    
+    def __init__(self, config: "Config"):
+        self.config = config
+        options = getattr(config, "_user_provided_options", None)
+        self._options = repr(sorted(options.items())) if isinstance(options, dict) else None
+    
+    def __eq__(self, other):
+        if not isinstance(other, _ConfigKey):
+            return False
+        if self._options is None or other._options is None:
+            return self.config is other.config
+        return self._options == other._options
+    
+    def __hash__(self):
+        if self._options is None:
+            return id(self.config)
+        return hash(self._options)
+
+@functools.lru_cache(maxsize=32)
+def _get_runtime_client(region_name: Optional[str], profile_name: Optional[str], config_key: Optional[_ConfigKey]):
+    """
+    Get a Bedrock Agents runtime client, shared by all clients with the same settings
+    
+    Creating a boto3 client resolves credentials and endpoints and sets up a
+    connection pool, so clients are created once per region, profile and config
+    options and reused. boto3 clients are thread-safe.
+    """
+    boto_config = config_key.config if config_key is not None else None
+    
+    import boto3
+    from botocore.config import Config
+    
+    session = boto3.Session(region_name=region_name, profile_name=profile_name)
+    config = Config(**DEFAULT_BOTO_OPTIONS)
+    if boto_config:
+        config = config.merge(boto_config)
+    return session.client('bedrock-agent-runtime', config=config)
+
+# Latency settings accepted in performance_config
+_PERFORMANCE_LATENCIES = ("standard", "optimized")
+
+# Returned by _execute_function when a function could not be called, so that a
+# function which legitimately returns None, 0 or an empty value isn't treated as failed
+_FUNCTION_FAILED = object()
+
+def _function_key(func: Union[Function, Callable]) -> Any:
+    """Cache key for the parts of a function that its definition is built from"""
+    if isinstance(func, Function):
+        return (func.name, func.description, func.function, func.action_group)
+    return func
+
 class Client:
-    """Client for interacting with Amazon Bedrock Agents"""
+    """
+    Client for interacting with Amazon Bedrock Agents
+    
+    The client is thread-safe and holds a pooled connection to Bedrock, so create
+    it once and reuse it for all runs rather than creating one per request.
+    """
     
     def __init__(self, 
                  region_name: Optional[str] = None, 
                  profile_name: Optional[str] = None,
                  verbosity: str = "normal",
                  trace_level: str = "none",
-                 max_tool_calls: int = 10):
+                 max_tool_calls: int = 10,
+                 performance_config: Optional[Union[str, Dict[str, str]]] = None,
+                 tool_concurrency: int = 8,
+                 boto_config: Optional["Config"] = None,
+                 trace_output: Optional[TextIO] = None):
         """
         Initialize the client
         
@@ -36,10 +136,22 @@ class Client:
                 Options: "none", "minimal", "standard", "detailed", "raw"
                 The "raw" level dumps the complete unprocessed trace data, including code interpreter output
             max_tool_calls: Maximum number of tool calls per run (default: 10)
+            performance_config: Model performance configuration sent with every invocation
+                (default: None, uses the Bedrock default). For example {"latency": "optimized"},
+                or just "optimized", enables latency-optimized inference on supported models.
+            tool_concurrency: Maximum number of functions executed at the same time when the
+                agent requests several function calls in one turn (default: 8)
+            boto_config: botocore Config merged over the SDK's connection defaults
+                (default: None, uses DEFAULT_BOTO_OPTIONS)
+            trace_output: Stream agent traces are written to, for example an open log file
+                (default: None, uses sys.stdout)
         """
-        # Set up session
-        session = boto3.Session(region_name=region_name, profile_name=profile_name)
-        self.bedrock_agent_runtime = session.client('bedrock-agent-runtime')
+        # The runtime client is created on first use (and shared with other
+        # clients using the same settings)
+        self.region_name = region_name
+        self.profile_name = profile_name
+        self.boto_config = boto_config
+        self._bedrock_agent_runtime = None
         
         # Configure logging
         self.verbosity = verbosity.lower()
@@ -49,13 +161,65 @@ class Client:
         # Configure agent traces
         self.trace_level = trace_level.lower()
         self.agent_traces = self.trace_level != "none"
+        self.trace_output = trace_output
         
         # Set maximum tool calls
         self.max_tool_calls = max_tool_calls
         
+        # Set model performance configuration
+        if isinstance(performance_config, str):
+            performance_config = {"latency": performance_config}
+        if performance_config and performance_config.get("latency") not in _PERFORMANCE_LATENCIES:
+            raise ValueError(f"performance_config latency must be one of {_PERFORMANCE_LATENCIES}, got {performance_config.get('latency')!r}")
+        self.performance_config = performance_config
+        
+        # Set maximum number of concurrent function executions. The thread pool
+        # is created on first use and shared by all runs on this client.
+        self.tool_concurrency = tool_concurrency
+        self._tool_executor = None
+        self._tool_executor_lock = threading.Lock()
+        
         if self.sdk_logs:
             print(f"[SDK LOG] Initialized Bedrock Agents client (region: {region_name or 'default'}, verbosity: {verbosity}, trace level: {trace_level})")
     
+    @property
+    def bedrock_agent_runtime(self):
+        """The Bedrock Agents runtime client, created on first use"""
+        if self._bedrock_agent_runtime is None:
+            with _RUNTIME_CLIENT_LOCK:
+                if self._bedrock_agent_runtime is None:
+                    config_key = _ConfigKey(self.boto_config) if self.boto_config is not None else None
+                    self._bedrock_agent_runtime = _get_runtime_client(self.region_name, self.profile_name, config_key)
+        return self._bedrock_agent_runtime
+    
+    @bedrock_agent_runtime.setter
+    def bedrock_agent_runtime(self, client):
+        self._bedrock_agent_runtime = client
+    
+    def prewarm(self):
+        """
+        Open a connection to the Bedrock Agents runtime ahead of the first run
+        
+        Issues a lightweight request so the TLS handshake is done before the first
+        agent invocation. Errors from the request itself (for example missing
+        permissions) are ignored, as the connection is established either way.
+        Errors reaching the runtime (for example missing credentials) are also
+        ignored, and are reported when the agent is first run instead.
+        """
+        from botocore.exceptions import BotoCoreError, ClientError
+        
+        try:
+            self.bedrock_agent_runtime.list_sessions(maxResults=1)
+        except ClientError as e:
+            if self.debug_logs:
+                print(f"[SDK LOG] Prewarm request returned an error (connection is still warm): {e}")
+        except BotoCoreError as e:
+            if self.sdk_logs:
+                print(f"[SDK LOG] Could not connect to Bedrock Agents runtime ahead of the first run: {e}")
+        else:
+            if self.sdk_logs:
+                print("[SDK LOG] Connection to Bedrock Agents runtime is ready")
+    
     def _build_action_groups(self, agent: Agent) -> List[Dict[str, Any]]:
         """Build action groups from agent's action_groups property or functions"""
         action_groups = []
@@ -87,20 +251,7 @@ class Client:
                             action_group=ag.name
                         )
                     
-                    # Extract parameter information
-                    params = extract_parameter_info(func_obj.function)
-                    
-                    function_def = {
-                        "name": func_obj.name,
-                        "description": func_obj.description,
-                        "requireConfirmation": "DISABLED"
-                    }
-                    
-                    # Add parameters if they exist
-                    if params:
-                        function_def["parameters"] = params
-                    
-                    action_group["functionSchema"]["functions"].append(function_def)
+                    action_group["functionSchema"]["functions"].append(func_obj.to_dict())
                 
                 action_groups.append(action_group)
                 
@@ -109,54 +260,31 @@ class Client:
         
         # If no action groups are defined, fall back to building them from functions
         else:
-            # Group functions by action group
+            # Group functions by action group, creating each action group the
+            # first time one of its functions is seen
             action_group_map = {}
             
             for func in agent.functions:
                 # Determine action group name
                 group_name = func.action_group or "DefaultActions"
                 
-                # Create action group if it doesn't exist
-                if group_name not in action_group_map:
-                    action_group_map[group_name] = []
-                
-                # Extract parameter information
-                params = extract_parameter_info(func.function)
+                action_group = action_group_map.get(group_name)
+                if action_group is None:
+                    action_group = action_group_map[group_name] = {
+                        "actionGroupName": group_name,
+                        "description": f"Actions related to {group_name.replace('Actions', '')}",
+                        "actionGroupExecutor": {
+                            "customControl": "RETURN_CONTROL"
+                        },
+                        "functionSchema": {
+                            "functions": []
+                        }
+                    }
                 
                 # Add function to action group
-                action_group_map[group_name].append({
-                    "name": func.name,
-                    "description": func.description,
-                    "parameters": params
-                })
+                action_group["functionSchema"]["functions"].append(func.to_dict())
             
-            # Create action groups
-            for group_name, functions in action_group_map.items():
-                action_group = {
-                    "actionGroupName": group_name,
-                    "description": f"Actions related to {group_name.replace('Actions', '')}",
-                    "actionGroupExecutor": {
-                        "customControl": "RETURN_CONTROL"
-                    },
-                    "functionSchema": {
-                        "functions": []
-                    }
-                }
-                
-                for func_info in functions:
-                    function_def = {
-                        "name": func_info["name"],
-                        "description": func_info["description"],
-                        "requireConfirmation": "DISABLED"
-                    }
-                    
-                    # Add parameters if they exist
-                    if func_info["parameters"]:
-                        function_def["parameters"] = func_info["parameters"]
-                    
-                    action_group["functionSchema"]["functions"].append(function_def)
-                
-                action_groups.append(action_group)
+            action_groups.extend(action_group_map.values())
                 
             if self.sdk_logs:
                 print(f"[SDK LOG] Built {len(action_groups)} action groups from agent.functions")
@@ -176,15 +304,58 @@ class Client:
         
         return action_groups
     
-    def _execute_function(self, function_map: Dict[str, Callable], function_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a function with given parameters"""
-        if function_name not in function_map:
+    def _prepare_agent(self, agent: Agent):
+        """
+        Get the action groups and function map for an agent
+        
+        Action groups and the function map are built on first use and cached on
+        the agent, so repeated runs don't rebuild them. They are rebuilt when
+        functions or action groups have been added, replaced or edited directly
+        (e.g. agent.functions.append(...) or changing an action group's
+        description), or the code interpreter setting has changed, since the
+        last build.
+        
+        Returns:
+            Tuple of the action groups and a map of function names to functions
+        """
+        # Everything the action groups are built from is cheap to compare, and
+        # this catches direct changes that don't go through add_function
+        cache_key = (
+            agent._schema_version,
+            agent.enable_code_interpreter,
+            tuple(_function_key(func) for func in agent.functions),
+            tuple(
+                (ag.name, ag.description, tuple(_function_key(func) for func in ag.functions))
+                for ag in agent.action_groups
+            )
+        )
+        if agent._action_groups_cache is None or agent._action_groups_cache_key != cache_key:
+            agent._action_groups_cache = self._build_action_groups(agent)
+            agent._action_groups_cache_key = cache_key
+            agent._function_map_cache = {func.name: func.function for func in agent.functions}
+        elif self.sdk_logs:
+            print(f"[SDK LOG] Reusing {len(agent._action_groups_cache)} action groups built for this agent")
+        
+        return agent._action_groups_cache, agent._function_map_cache
+    
+    def _execute_function(self, function_map: Dict[str, Callable], function_name: str, params: Dict[str, Any]) -> Any:
+        """Execute a function with given parameters, returning _FUNCTION_FAILED if it can't be called"""
+        func = function_map.get(function_name)
+        if func is None:
             if self.sdk_logs:
                 print(f"\n[SDK LOG] Error: Function '{function_name}' is not registered")
-            return None
+            return _FUNCTION_FAILED
             
         try:
-            func = function_map[function_name]
+            if inspect.iscoroutinefunction(func):
+                # Async functions run to completion on their own event loop. That
+                # can't be started on a thread already running one (e.g. Jupyter or
+                # an async app), so the coroutine is run on a tool thread instead.
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    return asyncio.run(func(**params))
+                return self._get_tool_executor().submit(asyncio.run, func(**params)).result()
             if params:
                 return func(**params)
             return func()
@@ -192,11 +363,51 @@ class Client:
             if self.sdk_logs:
                 print(f"\n[SDK LOG] Error calling function '{function_name}': {e}")
                 print(f"[SDK LOG] Parameters provided: {params}")
-            return None
+            return _FUNCTION_FAILED
         except Exception as e:
             if self.sdk_logs:
                 print(f"\n[SDK LOG] Unexpected error in function '{function_name}': {e}")
-            return None
+            return _FUNCTION_FAILED
+    
+    def _execute_function_calls(self, function_map: Dict[str, Callable], function_inputs: List[Dict[str, Any]], parallel: bool = True) -> List[Any]:
+        """
+        Execute the function calls requested in a single return control event
+        
+        Independent calls are run concurrently on a thread pool, unless parallel
+        is False. Results are returned in the same order as function_inputs.
+        """
+        calls = []
+        for function_input in function_inputs:
+            function_name = function_input.get("function")
+            parameters = function_input.get("parameters", [])
+            
+            if self.sdk_logs:
+                print(f"\n[SDK LOG] Function requested: {function_name}")
+                print(f"[SDK LOG] From action group: {function_input.get('actionGroup')}")
+                if parameters:
+                    print(f"[SDK LOG] With parameters: {parameters}")
+                else:
+                    print(f"[SDK LOG] No parameters provided")
+            
+            calls.append((function_name, convert_parameters(parameters, self.sdk_logs)))
+        
+        if len(calls) == 1 or not parallel:
+            return [self._execute_function(function_map, name, params) for name, params in calls]
+        
+        executor = self._get_tool_executor()
+        futures = [executor.submit(self._execute_function, function_map, name, params) for name, params in calls]
+        return [future.result() for future in futures]
+    
+    def _get_tool_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool used for concurrent function calls, creating it on first use"""
+        if self._tool_executor is None:
+            with self._tool_executor_lock:
+                if self._tool_executor is None:
+                    self._tool_executor = ThreadPoolExecutor(
+                        max_workers=self.tool_concurrency,
+                        thread_name_prefix="bedrock-agents-tool"
+                    )
+        return self._tool_executor
     
     def _invoke_agent(self, 
                      agent: Agent, 
@@ -205,29 +416,33 @@ class Client:
                      session_id: str,
                      input_text: Optional[str] = None, 
                      invocation_id: Optional[str] = None, 
-                     return_control_result: Optional[Dict[str, Any]] = None, 
+                     return_control_results: Optional[List[Dict[str, Any]]] = None, 
                      accumulated_text: str = "",
-                     tool_call_count: int = 0) -> Dict[str, Any]:
+                     tool_call_count: int = 0,
+                     on_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
-        Invoke the agent with either user input or function result
-        This method handles the entire flow recursively until completion
+        Invoke the agent with either user input or function results
+        This method handles the entire flow, looping over function calls until completion
+        
+        Args:
+            on_text: Optional callback given the response text as it arrives, before
+                any post_process plugin hooks are applied
         
         Returns:
             Dict[str, Any]: Dictionary containing the response text and any files
         """
-        tool_call_count += 1
-        if tool_call_count > self.max_tool_calls:
-            return {
-                "response": accumulated_text + "\n\nReached maximum number of tool calls. Some tasks may be incomplete.",
-                "files": []
-            }
+        # Settings read on every turn
+        sdk_logs = self.sdk_logs
+        agent_traces = self.agent_traces
+        max_tool_calls = self.max_tool_calls
         
-        if self.sdk_logs and tool_call_count > 1:
-            print(f"\n[SDK LOG] Processing function call #{tool_call_count - 1}...")
+        output_files = []
+        # Response text from each turn, joined with newlines once at the end
+        text_parts = [accumulated_text] if accumulated_text else []
         
         try:
-            # Prepare parameters for the API call
-            params = {
+            # Prepare the parameters shared by every API call in this run
+            base_params = {
                 "sessionId": session_id,
                 "actionGroups": action_groups,
                 "instruction": agent.instructions,
@@ -235,186 +450,199 @@ class Client:
                 "enableTrace": self.agent_traces
             }
             
+            # Add model performance configuration if provided (the agent's setting takes precedence)
+            performance_config = {"latency": "optimized"} if agent.latency_optimized else self.performance_config
+            if performance_config:
+                base_params["bedrockModelConfigurations"] = {
+                    "performanceConfig": performance_config
+                }
+            
             # Add advanced configuration if provided
             if agent.advanced_config:
-                params.update(agent.advanced_config)
+                base_params.update(agent.advanced_config)
+            
+            # Files are sent with every call, so build their payload once
+            files_payload = [f.to_dict() for f in agent.files]
             
-            # Determine if this is an initial call or a follow-up call
-            if input_text is not None:
-                # Initial call with user input
-                if self.sdk_logs:
-                    truncated_input = input_text[:50] + "..." if len(input_text) > 50 else input_text
-                    print(f"\n[SDK LOG] Sending user query to agent: '{truncated_input}'")
+            while True:
+                tool_call_count += 1
+                if tool_call_count > max_tool_calls:
+                    text_parts.append("\nReached maximum number of tool calls. Some tasks may be incomplete.")
+                    if on_text is not None:
+                        on_text("\n" + text_parts[-1])
+                    break
+                
+                if sdk_logs and tool_call_count > 1:
+                    print(f"\n[SDK LOG] Processing function call #{tool_call_count - 1}...")
                 
-                params["inputText"] = input_text
+                # Copy the shared parameters, as this turn's inputs are added to them
+                params = dict(base_params)
                 
-                # Add files if provided
-                if agent.files:
-                    if self.sdk_logs:
-                        print(f"\n[SDK LOG] Sending {len(agent.files)} file(s) to agent")
+                # Determine if this is an initial call or a follow-up call
+                if input_text is not None:
+                    # Initial call with user input
+                    if sdk_logs:
+                        truncated_input = input_text[:50] + "..." if len(input_text) > 50 else input_text
+                        print(f"\n[SDK LOG] Sending user query to agent: '{truncated_input}'")
+                    
+                    params["inputText"] = input_text
+                    
+                    # Add files if provided
+                    if agent.files:
+                        if sdk_logs:
+                            print(f"\n[SDK LOG] Sending {len(agent.files)} file(s) to agent")
+                        
+                        params["inlineSessionState"] = {
+                            "files": files_payload
+                        }
+                else:
+                    # Follow-up call with function result
+                    if sdk_logs:
+                        print(f"\n[SDK LOG] Sending {len(return_control_results)} function result(s) back to agent (invocation ID: {invocation_id})")
                     
-                    params["inlineSessionState"] = {
-                        "files": [f.to_dict() for f in agent.files]
+                    inline_session_state = {
+                        "invocationId": invocation_id,
+                        "returnControlInvocationResults": return_control_results
                     }
-            else:
-                # Follow-up call with function result
-                if self.sdk_logs:
-                    print(f"\n[SDK LOG] Sending function result back to agent (invocation ID: {invocation_id})")
+                    
+                    # Add files if provided
+                    if agent.files:
+                        if sdk_logs:
+                            print(f"\n[SDK LOG] Sending {len(agent.files)} file(s) to agent")
+                        inline_session_state["files"] = files_payload
+                    
+                    params["inlineSessionState"] = inline_session_state
                 
-                inline_session_state = {
-                    "invocationId": invocation_id,
-                    "returnControlInvocationResults": [return_control_result]
-                }
+                # Apply agent plugins pre-invoke. Plugins may modify the parameters in
+                # place, so they get a deep copy that doesn't share the action groups
+                # cached on the agent or the files sent on every turn.
+                if agent.plugins:
+                    params = copy.deepcopy(params)
+                for plugin in agent.plugins:
+                    new_params = plugin.pre_invoke(params)
+                    if new_params is not None:
+                        params = new_params
                 
-                # Add files if provided
-                if agent.files:
-                    if self.sdk_logs:
-                        print(f"\n[SDK LOG] Sending {len(agent.files)} file(s) to agent")
-                    inline_session_state["files"] = [f.to_dict() for f in agent.files]
+                # Call the API
+                response = self.bedrock_agent_runtime.invoke_inline_agent(**params)
                 
-                params["inlineSessionState"] = inline_session_state
-            
-            # Apply agent plugins pre-invoke
-            for plugin in agent.plugins:
-                params = plugin.pre_invoke(params)
-            
-            # Call the API
-            response = self.bedrock_agent_runtime.invoke_inline_agent(**params)
-            
-            # Apply agent plugins post-invoke
-            for plugin in agent.plugins:
-                response = plugin.post_invoke(response)
-            
-            # Process the response
-            return_control = None
-            response_text = ""
-            output_files = []
-            
-            for event in response["completion"]:
-                if "returnControl" in event:
-                    return_control = event["returnControl"]
-                    if self.sdk_logs:
-                        print("\n[SDK LOG] Agent needs to call a function...")
-                    break
-                elif "chunk" in event and "bytes" in event["chunk"]:
-                    text = event["chunk"]["bytes"].decode('utf-8')
-                    response_text += text
-                elif "files" in event:
-                    # Process files from the response
-                    for file_data in event["files"].get("files", []):
-                        output_file = OutputFile.from_response(file_data)
-                        output_files.append(output_file)
-                        if self.sdk_logs:
-                            print(f"\n[SDK LOG] Received file: {output_file.name} ({len(output_file.content)} bytes, type: {output_file.type})")
-                elif "trace" in event:
-                    # Process trace information using the helper method
-                    process_trace_data(event["trace"], self.agent_traces, self.trace_level)
-            
-            # Update accumulated text with any new response text
-            if response_text:
-                # Only add a separator if we already have accumulated text
-                if accumulated_text:
-                    accumulated_text += "\n"
-                accumulated_text += response_text
-                if self.sdk_logs and not return_control:
-                    print("\n[SDK LOG] Agent has completed its response")
-            
-            # If no tool call is needed, prepare the final result
-            if not return_control:
-                result = {
-                    "response": accumulated_text,
-                    "files": output_files
-                }
-                
-                # Apply agent plugins post-process
+                # Apply agent plugins post-invoke
                 for plugin in agent.plugins:
-                    result = plugin.post_process(result)
+                    new_response = plugin.post_invoke(response)
+                    if new_response is not None:
+                        response = new_response
                 
-                return result
-            
-            # Extract function details
-            invocation_id = return_control["invocationId"]
-            function_input = return_control.get("invocationInputs", [])[0].get("functionInvocationInput", {})
-            function_name = function_input.get("function")
-            action_group = function_input.get("actionGroup")
-            parameters = function_input.get("parameters", [])
-            
-            if self.sdk_logs:
-                print(f"\n[SDK LOG] Function requested: {function_name}")
-                print(f"[SDK LOG] From action group: {action_group}")
-                if parameters:
-                    print(f"[SDK LOG] With parameters: {parameters}")
-                else:
-                    print(f"[SDK LOG] No parameters provided")
-            
-            # Convert and execute
-            params = convert_parameters(parameters, self.sdk_logs)
-            result = self._execute_function(function_map, function_name, params)
-            
-            if not result:
-                if self.sdk_logs:
-                    print(f"\n[SDK LOG] Warning: Function {function_name} did not return a result")
-                final_result = {
-                    "response": accumulated_text,
-                    "files": output_files
-                }
+                # Process the response
+                return_control = None
+                chunks = []
+                # Each turn's text is joined to the previous turn's with a newline
+                separator = "\n" if text_parts else ""
+                decoder = codecs.getincrementaldecoder('utf-8')()
                 
-                # Apply agent plugins post-process
-                for plugin in agent.plugins:
-                    final_result = plugin.post_process(final_result)
+                for event in response["completion"]:
+                    if "returnControl" in event:
+                        return_control = event["returnControl"]
+                        if sdk_logs:
+                            print("\n[SDK LOG] Agent needs to call a function...")
+                        break
+                    elif "chunk" in event and "bytes" in event["chunk"]:
+                        # Multi-byte characters may be split across chunks
+                        text = decoder.decode(event["chunk"]["bytes"])
+                        chunks.append(text)
+                        if on_text is not None and text:
+                            on_text(separator + text)
+                            separator = ""
+                    elif "files" in event:
+                        # Process files from the response
+                        for file_data in event["files"].get("files", []):
+                            output_file = OutputFile.from_response(file_data)
+                            output_files.append(output_file)
+                            if sdk_logs:
+                                print(f"\n[SDK LOG] Received file: {output_file.name} ({len(output_file.content)} bytes, type: {output_file.type})")
+                    elif "trace" in event and agent_traces:
+                        # Process trace information using the helper method
+                        process_trace_data(event["trace"], agent_traces, self.trace_level, self.trace_output)
                 
-                return final_result
-            
-            if self.sdk_logs:
-                print(f"\n[SDK LOG] Function executed successfully. Result: {result}")
-            
-            # Create return control result
-            return_control_result = {
-                "functionResult": {
-                    "actionGroup": action_group,
-                    "function": function_name,
-                    "responseBody": {
-                        "application/json": {
-                            "body": json.dumps(result)
+                # Update accumulated text with any new response text
+                text = decoder.decode(b"", final=True)
+                if text:
+                    chunks.append(text)
+                    if on_text is not None:
+                        on_text(separator + text)
+                response_text = "".join(chunks)
+                if response_text:
+                    text_parts.append(response_text)
+                    if sdk_logs and not return_control:
+                        print("\n[SDK LOG] Agent has completed its response")
+                
+                # If no tool call is needed, the response is complete
+                if not return_control:
+                    break
+                
+                # Extract function details
+                invocation_id = return_control["invocationId"]
+                function_inputs = [
+                    invocation_input.get("functionInvocationInput", {})
+                    for invocation_input in return_control.get("invocationInputs", [])
+                ]
+                
+                # Convert and execute
+                results = self._execute_function_calls(function_map, function_inputs, parallel=agent.parallel_tool_calls)
+                
+                return_control_results = []
+                for function_input, result in zip(function_inputs, results):
+                    function_name = function_input.get("function")
+                    
+                    if result is _FUNCTION_FAILED:
+                        if sdk_logs:
+                            print(f"\n[SDK LOG] Warning: Function {function_name} could not be executed")
+                        return_control_results = None
+                        break
+                    
+                    if sdk_logs:
+                        print(f"\n[SDK LOG] Function executed successfully. Result: {result}")
+                    
+                    # Create return control result
+                    return_control_results.append({
+                        "functionResult": {
+                            "actionGroup": function_input.get("actionGroup"),
+                            "function": function_name,
+                            "responseBody": {
+                                "application/json": {
+                                    "body": serialize_result(result)
+                                }
+                            }
                         }
-                    }
-                }
-            }
-            
-            # Recursive call with the function result
-            result = self._invoke_agent(
-                agent=agent,
-                action_groups=action_groups,
-                function_map=function_map,
-                session_id=session_id,
-                input_text=None,
-                invocation_id=invocation_id,
-                return_control_result=return_control_result,
-                accumulated_text=accumulated_text,
-                tool_call_count=tool_call_count
-            )
-            
-            # Merge files from this call with any files from recursive calls
-            all_files = output_files + result.get("files", [])
-            final_result = {
-                "response": result.get("response", ""),
-                "files": all_files
-            }
-            
-            # Apply agent plugins post-process
-            for plugin in agent.plugins:
-                final_result = plugin.post_process(final_result)
-            
-            return final_result
+                    })
+                
+                # Stop if a function failed, otherwise send the results back to the agent
+                if return_control_results is None:
+                    break
+                input_text = None
             
         except Exception as e:
             error_msg = f"Error in agent invocation: {e}"
-            if self.sdk_logs:
+            if sdk_logs:
                 print(f"\n[SDK LOG] {error_msg}")
+            if on_text is not None:
+                on_text(f"\nAn error occurred: {str(e)}")
             return {
                 "response": f"An error occurred: {str(e)}",
-                "files": []
+                "files": output_files
             }
+        
+        final_result = {
+            "response": "\n".join(text_parts),
+            "files": output_files
+        }
+        
+        # Apply agent plugins post-process
+        for plugin in agent.plugins:
+            new_result = plugin.post_process(final_result)
+            if new_result is not None:
+                final_result = new_result
+        
+        return final_result
     
     def run(self, agent: Agent, message: Optional[str] = None, messages: Optional[List[Union[Message, Dict[str, str]]]] = None, session_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -442,15 +670,12 @@ class Client:
         if self.sdk_logs:
             print(f"\n[SDK LOG] Starting new run session (ID: {session_id})")
         
-        # Build action groups
-        action_groups = self._build_action_groups(agent)
-        
-        # Create a map of function names to functions
-        function_map = {func.name: func.function for func in agent.functions}
+        # Get the action groups and function map (built once per agent)
+        action_groups, function_map = self._prepare_agent(agent)
         
-        # Handle simple string input by converting it to a user message
+        # A simple string input is already the user's text
         if message is not None:
-            last_message = Message(role="user", content=message)
+            input_text = message
         else:
             # Get the last user message from the list
             last_message = messages[-1]
@@ -459,6 +684,7 @@ class Client:
             
             if last_message.role != "user":
                 raise ValueError("The last message must be from the user")
+            input_text = last_message.content
         
         # Invoke the agent
         result = self._invoke_agent(
@@ -466,7 +692,7 @@ class Client:
             action_groups=action_groups,
             function_map=function_map,
             session_id=session_id,
-            input_text=last_message.content,
+            input_text=input_text,
             tool_call_count=0
         )
         
@@ -480,34 +706,115 @@ class Client:
         if result.get("files"):
             # Add a method to save all files
             def save_all_files(directory="."):
-                """Save all files to the specified directory"""
-                saved_paths = []
-                for file in result["files"]:
-                    path = file.save(directory)
-                    saved_paths.append(path)
-                return saved_paths
+                """Save all files to the specified directory, creating it if needed"""
+                os.makedirs(directory, exist_ok=True)
+                files = result["files"]
+                if len(files) == 1:
+                    return [files[0].save(directory)]
+                
+                # Write the files concurrently; paths are returned in file order
+                with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+                    return list(executor.map(lambda file: file.save(directory), files))
             
             result["save_all_files"] = save_all_files
         
         return result
     
-    def chat(self, agent: Agent, session_id: Optional[str] = None):
+    def run_batch(self, agent: Agent, message_lists: List[List[Union[Message, Dict[str, str]]]], max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Run the agent on several independent conversations concurrently
+        
+        Each conversation is run in its own session, so the Bedrock round-trips
+        overlap instead of running one after another.
+        
+        Args:
+            agent: The agent configuration
+            message_lists: A list of conversations, each a list of messages as accepted by run()
+            max_workers: Maximum number of conversations to run at the same time (default: 8)
+            
+        Returns:
+            List[Dict[str, Any]]: One result per conversation, in the same order as message_lists
+        """
+        if not message_lists:
+            return []
+        
+        # Build the action groups and function map up front, so the workers all
+        # reuse them instead of racing to build them on their first run
+        self._prepare_agent(agent)
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(message_lists))) as executor:
+            futures = [executor.submit(self.run, agent=agent, messages=messages) for messages in message_lists]
+            return [future.result() for future in futures]
+    
+    async def arun(self, agent: Agent, message: Optional[str] = None, messages: Optional[List[Union[Message, Dict[str, str]]]] = None, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run the agent from async code without blocking the event loop
+        
+        Takes the same arguments as run(). The run happens on the event loop's
+        default executor, so several runs can be awaited concurrently, for
+        example with asyncio.gather.
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing the response text and any files
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.run, agent=agent, message=message, messages=messages, session_id=session_id)
+        )
+    
+    async def arun_batch(self, agent: Agent, message_lists: List[List[Union[Message, Dict[str, str]]]], max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Run the agent on several independent conversations from async code
+        
+        The async counterpart of run_batch(). At most max_concurrency
+        conversations are in flight at a time.
+        
+        Args:
+            agent: The agent configuration
+            message_lists: A list of conversations, each a list of messages as accepted by run()
+            max_concurrency: Maximum number of conversations to run at the same time (default: 8)
+            
+        Returns:
+            List[Dict[str, Any]]: One result per conversation, in the same order as message_lists
+        """
+        if not message_lists:
+            return []
+        
+        # Build the action groups and function map once for all conversations
+        self._prepare_agent(agent)
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_one(messages):
+            async with semaphore:
+                return await self.arun(agent=agent, messages=messages)
+        
+        return list(await asyncio.gather(*[run_one(messages) for messages in message_lists]))
+    
+    def chat(self, agent: Agent, session_id: Optional[str] = None, stream: bool = False):
         """
         Start an interactive chat session with the agent
         
         Args:
             agent: The agent configuration
             session_id: Optional session ID to continue a conversation. If not provided, a new session will be created.
+            stream: Print the agent's response as it arrives rather than once it is complete.
+                Ignored if any of the agent's plugins has a post_process hook, as that may
+                change the response after it has arrived.
         """
+        from botocore.exceptions import ClientError
+        
         # Create a session ID if not provided
         if session_id is None:
             session_id = str(uuid.uuid4())
         
-        # Build action groups
-        action_groups = self._build_action_groups(agent)
+        # Only stream when the response is shown exactly as it arrives
+        if stream and any(type(plugin).post_process is not AgentPlugin.post_process for plugin in agent.plugins):
+            stream = False
         
-        # Create a map of function names to functions
-        function_map = {func.name: func.function for func in agent.functions}
+        # Get the action groups and function map (built once per agent)
+        action_groups, function_map = self._prepare_agent(agent)
         
         print(f"\n[SESSION] Starting chat session (ID: {session_id})")
         print("[SESSION] Type 'exit' or 'quit' to end the chat")
@@ -544,6 +851,18 @@ class Client:
                     print("[SESSION] All files have been cleared")
                     continue
                 
+                # Print the response text as it arrives when streaming
+                streamed = []
+                
+                def print_text(text):
+                    if not streamed:
+                        text = text.lstrip()
+                        if not text:
+                            return
+                        print("\nAssistant: ", end="")
+                    streamed.append(text)
+                    print(text, end="", flush=True)
+                
                 # Invoke the agent
                 result = self._invoke_agent(
                     agent=agent,
@@ -551,11 +870,15 @@ class Client:
                     function_map=function_map,
                     session_id=session_id,
                     input_text=user_input,
-                    tool_call_count=0
+                    tool_call_count=0,
+                    on_text=print_text if stream else None
                 )
                 
-                # Print the agent's final response
-                print("\nAssistant:", result["response"].strip())
+                # Print the agent's final response, or end the streamed one
+                if streamed:
+                    print()
+                else:
+                    print("\nAssistant:", result["response"].strip())
                 
                 # Handle any files returned by the agent
                 if result.get("files"):
@@ -16,26 +16,29 @@ class ActionGroup(BaseModel):
     
     def __init__(self, **data):
         """Initialize the action group and process functions if provided"""
+        # Convert callables before validation so the fields are only set once
+        if data.get('functions'):
+            data['functions'] = self._process_functions(data['functions'], data.get('name'))
         super().__init__(**data)
-        self._process_functions()
     
-    def _process_functions(self):
+    @classmethod
+    def _process_functions(cls, functions: List[Union[Function, Callable]], action_group: Optional[str]) -> List[Function]:
         """Process functions provided in the constructor"""
         processed_functions = []
         
         # Process each function
-        for item in self.functions:
+        for item in functions:
             if isinstance(item, Function):
                 # Already a Function object, keep as is
                 processed_functions.append(item)
             elif callable(item):
                 # Convert callable to Function object
-                processed_functions.append(self._create_function(item))
+                processed_functions.append(cls._create_function(item, action_group))
         
-        # Replace the original functions list with processed functions
-        self.functions = processed_functions
+        return processed_functions
     
-    def _create_function(self, function: Callable, description: Optional[str] = None) -> Function:
+    @staticmethod
+    def _create_function(function: Callable, action_group: Optional[str], description: Optional[str] = None) -> Function:
         """Create a Function object from a callable"""
         func_name = function.__name__
         
@@ -48,9 +51,10 @@ class ActionGroup(BaseModel):
         else:
             func_desc = f"Execute the {func_name} function"
         
-        return Function(
+        # The fields are built here, so pydantic validation can be skipped
+        return Function.model_construct(
             name=func_name,
             description=func_desc,
             function=function,
-            action_group=self.name
+            action_group=action_group
         ) 
\ No newline at end of file
@@ -25,6 +25,8 @@ class Agent:
     files: List[InputFile] = field(default_factory=list)
     plugins: List[Union[AgentPlugin, BedrockAgentsPlugin, ClientPlugin]] = field(default_factory=list)
     advanced_config: Optional[Dict[str, Any]] = None
+    latency_optimized: bool = False
+    parallel_tool_calls: bool = True
     
     model_config = ConfigDict(arbitrary_types_allowed=True)
     
@@ -37,15 +39,27 @@ class Agent:
         self.action_groups = []
         self.enable_code_interpreter = False
         self.advanced_config = None
+        self.latency_optimized = False
+        self.parallel_tool_calls = True
         self._custom_dependencies = {}
         
+        # Action groups built by the client, tagged with the schema version they
+        # were built for. The version is bumped whenever functions are added.
+        self._schema_version = 0
+        self._action_groups_cache = None
+        self._action_groups_cache_key = None
+        self._function_map_cache = {}
+        
         # Handle dictionary format for functions
         if 'functions' in data and isinstance(data['functions'], dict):
             action_groups_dict = data.pop('functions')
             processed_functions = []
             
-            # Create ActionGroup objects from the dictionary
-            for group_name, funcs in action_groups_dict.items():
+            # Create ActionGroup objects from the dictionary. Groups and their functions
+            # are sorted by name so the generated tool schema doesn't depend on the
+            # order they were written in.
+            for group_name, funcs in sorted(action_groups_dict.items()):
+                funcs = sorted(funcs, key=lambda f: f.name if isinstance(f, Function) else f.__name__)
                 action_group = ActionGroup(
                     name=group_name,
                     description=f"Functions related to {group_name}",
@@ -68,6 +82,9 @@ class Agent:
         # Process action groups to ensure all functions are in the functions list
         self._process_action_groups()
         
+        # Map function names to callables once, rather than on every run
+        self._function_map_cache = {func.name: func.function for func in self.functions}
+        
     def _process_functions(self):
         """Process functions provided in the constructor"""
         processed_functions = []
@@ -111,16 +128,24 @@ class Agent:
         else:
             func_desc = f"Execute the {func_name} function"
         
-        return Function(
+        # The fields are built here, so pydantic validation can be skipped
+        return Function.model_construct(
             name=func_name,
             description=func_desc,
             function=function,
             action_group=action_group
         )
     
+    def _invalidate_cache(self):
+        """Mark the cached action groups stale and refresh the function map after a change to the functions"""
+        self._schema_version += 1
+        self._function_map_cache = {func.name: func.function for func in self.functions}
+    
     def add_function(self, function: Callable, description: Optional[str] = None, action_group: Optional[str] = None):
         """Add a function to the agent"""
-        self.functions.append(self._create_function(function, description, action_group))
+        func = self._create_function(function, description, action_group)
+        self.functions.append(func)
+        self._invalidate_cache()
         return self
 
     def add_action_group(self, action_group: ActionGroup):
@@ -147,6 +172,7 @@ class Agent:
                 if func_obj.name not in [f.name for f in self.functions]:
                     self.functions.append(func_obj)
         
+        self._invalidate_cache()
         return self
 
     def add_file(self, name: str, content: bytes, media_type: str, use_case: str = "CODE_INTERPRETER") -> InputFile:
@@ -1,8 +1,10 @@
 """
 Function model for Bedrock Agents SDK.
 """
-from typing import Callable, Optional
-from pydantic import BaseModel, ConfigDict
+from typing import Any, Callable, Dict, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+from bedrock_agents_sdk.utils.parameter_extraction import extract_parameter_info
 
 class Function(BaseModel):
     """Represents a function that can be called by the agent"""
@@ -11,4 +13,29 @@ class Function(BaseModel):
     function: Callable
     action_group: Optional[str] = None
     
-    model_config = ConfigDict(arbitrary_types_allowed=True) 
\ No newline at end of file
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
+    # Function definition built by to_dict(), reused by every action group build
+    # until one of the fields it is built from changes
+    _function_def: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _function_def_key: Optional[Tuple[str, str, Callable]] = PrivateAttr(default=None)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the function definition used in an action group's function schema"""
+        key = (self.name, self.description, self.function)
+        if self._function_def is None or self._function_def_key != key:
+            function_def = {
+                "name": self.name,
+                "description": self.description,
+                "requireConfirmation": "DISABLED"
+            }
+            
+            # Add parameters if they exist
+            params = extract_parameter_info(self.function)
+            if params:
+                function_def["parameters"] = params
+            
+            self._function_def = function_def
+            self._function_def_key = key
+        
+        return self._function_def
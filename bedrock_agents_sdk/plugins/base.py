@@ -4,7 +4,14 @@ Base plugin class for Bedrock Agents SDK.
 from typing import Dict, Any
 
 class AgentPlugin:
-    """Base class for all plugins for the Bedrock Agents SDK"""
+    """
+    Base class for all plugins for the Bedrock Agents SDK
+    
+    The pre_invoke, post_invoke and post_process hooks can either return a
+    new value or modify the one they are given in place and return None.
+    pre_invoke is given a copy of the request parameters, so changes to them
+    only affect that request.
+    """
     
     def pre_invoke(self, params):
         """Called before invoke_inline_agent, can modify params"""
@@ -1,8 +1,50 @@
 """
 Utility functions for parameter conversion.
 """
+import json
 from typing import Dict, Any, List
 
+# Accepted spellings for boolean parameter values
+_TRUE_VALUES = frozenset({"true", "yes", "1"})
+_FALSE_VALUES = frozenset({"false", "no", "0"})
+
+def _to_number(value: str) -> Any:
+    """Convert a number string to an int, or a float if it has a fractional part"""
+    try:
+        # Most numbers are plain integers, which int() parses directly
+        return int(value)
+    except ValueError:
+        pass
+    
+    value = float(value)
+    if value.is_integer():
+        return int(value)
+    return value
+
+def _to_boolean(value: str) -> Any:
+    """Convert a boolean string, leaving unrecognised values unchanged"""
+    lowered = value.lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    return value
+
+def _to_array(value: str) -> list:
+    """Convert a JSON array string to a list"""
+    value = json.loads(value)
+    if not isinstance(value, list):
+        raise ValueError("not a JSON array")
+    return value
+
+# Converters for each agent parameter type. Strings need no conversion, and a
+# converter raises ValueError if the value can't be converted.
+_CONVERTERS = {
+    "number": _to_number,
+    "boolean": _to_boolean,
+    "array": _to_array
+}
+
 def convert_parameters(parameters: List[Dict[str, Any]], sdk_logs: bool = False) -> Dict[str, Any]:
     """
     Convert parameters from agent format to Python format
@@ -18,25 +60,23 @@ def convert_parameters(parameters: List[Dict[str, Any]], sdk_logs: bool = False)
     for param in parameters:
         name = param.get("name")
         value = param.get("value")
-        param_type = param.get("type")
+        converter = _CONVERTERS.get(param.get("type"))
         
-        if param_type == "number":
+        # Values that are already typed need no conversion
+        if converter is not None and isinstance(value, str):
             try:
-                value = float(value)
-                if value.is_integer():
-                    value = int(value)
+                value = converter(value)
             except ValueError:
+                if converter is _to_number:
+                    # Parameters with invalid numbers are left out
+                    if sdk_logs:
+                        print(f"\n[SDK LOG] Warning: Could not convert {value} to number")
+                    continue
                 if sdk_logs:
-                    print(f"\n[SDK LOG] Warning: Could not convert {value} to number")
-                continue
-        elif param_type == "boolean":
-            if value.lower() in ["true", "yes", "1"]:
-                value = True
-            elif value.lower() in ["false", "no", "0"]:
-                value = False
+                    print(f"\n[SDK LOG] Warning: Could not convert {value} to {param.get('type')}, passing it as a string")
         
         param_dict[name] = value
     
     if sdk_logs:
         print(f"[SDK LOG] Parameters processed: {param_dict}")
-    return param_dict 
\ No newline at end of file
+    return param_dict
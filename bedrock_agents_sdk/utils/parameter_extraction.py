@@ -2,7 +2,28 @@
 Utility functions for parameter extraction.
 """
 import inspect
-from typing import Dict, Any, Callable
+import re
+from typing import Dict, Any, Callable, get_args, get_origin
+
+# Matches ":param name: description" lines in a docstring
+_PARAM_DOC_RE = re.compile(r'^[ \t]*:param[ \t]+(\w+):[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
+# Agent parameter types for annotated Python types, anything else is a string
+_TYPE_MAP = {int: "number", float: "number", bool: "boolean", str: "string", list: "array"}
+
+def _parameter_type(annotation: Any) -> str:
+    """Get the agent parameter type for a type annotation"""
+    param_type = _TYPE_MAP.get(annotation)
+    if param_type is not None:
+        return param_type
+    
+    # Unwrap Optional[X] (and X | None) to X
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    if len(args) == 1 and len(get_args(annotation)) == 2:
+        return _parameter_type(args[0])
+    
+    # Generic aliases such as List[int] map by their origin type
+    return _TYPE_MAP.get(get_origin(annotation), "string")
 
 def extract_parameter_info(function: Callable) -> Dict[str, Dict[str, Any]]:
     """
@@ -17,30 +38,22 @@ def extract_parameter_info(function: Callable) -> Dict[str, Dict[str, Any]]:
     params = {}
     sig = inspect.signature(function)
     
+    # Collect all parameter descriptions from the docstring in one pass
+    param_docs = dict(_PARAM_DOC_RE.findall(function.__doc__)) if function.__doc__ else {}
+    
     for param_name, param in sig.parameters.items():
         # Skip self parameter for methods
         if param_name == 'self':
             continue
             
         # Determine parameter type from annotations or default to string
-        param_type = "string"
-        if param.annotation != inspect.Parameter.empty:
-            if param.annotation == int or param.annotation == float:
-                param_type = "number"
-            elif param.annotation == bool:
-                param_type = "boolean"
+        param_type = _parameter_type(param.annotation)
         
         # Determine if parameter is required
         required = param.default == inspect.Parameter.empty
         
         # Look for parameter description in docstring
-        param_desc = f"The {param_name} parameter"
-        if function.__doc__:
-            # Look for :param param_name: in docstring
-            for line in function.__doc__.split('\n'):
-                line = line.strip()
-                if line.startswith(f":param {param_name}:"):
-                    param_desc = line.split(f":param {param_name}:")[1].strip()
+        param_desc = param_docs.get(param_name, f"The {param_name} parameter")
         
         # Add parameter definition
         params[param_name] = {
@@ -0,0 +1,36 @@
+"""
+Utility functions for serializing function results.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def serialize_result(result: Any) -> str:
+    """
+    Serialize a function result for the response body sent back to the agent
+    
+    Results are JSON encoded, using orjson when it is installed. Strings are
+    encoded too, as the body is sent as application/json. Bytes are decoded as
+    UTF-8 and encoded as a string.
+    
+    Args:
+        result: The value returned by the function
+        
+    Returns:
+        The result as a string
+    """
+    if isinstance(result, (bytes, bytearray)):
+        result = result.decode('utf-8')
+    
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            # Types orjson can't encode fall back to the standard library
+            pass
+    
+    return json.dumps(result)
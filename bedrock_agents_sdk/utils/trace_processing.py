@@ -1,17 +1,106 @@
 """
 Utility functions for trace processing.
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, TextIO
 import json
+import sys
 
-def process_trace_data(trace_data: Dict[str, Any], agent_traces: bool, trace_level: str) -> None:
+# Trace levels that show the inputs of each invocation
+_INVOCATION_TRACE_LEVELS = frozenset({"standard", "detailed"})
+
+def _add_orchestration_trace(trace: Dict[str, Any], trace_level: str, lines: List[str]) -> None:
+    """Add the orchestration trace (main reasoning and decision making) to lines"""
+    orchestration = trace.get("orchestrationTrace")
+    if orchestration is None:
+        return
+    
+    # Display model reasoning if available (all trace levels)
+    if "modelInvocationOutput" in orchestration and "reasoningContent" in orchestration["modelInvocationOutput"]:
+        reasoning = orchestration["modelInvocationOutput"]["reasoningContent"]
+        if "reasoningText" in reasoning and "text" in reasoning["reasoningText"]:
+            reasoning_text = reasoning["reasoningText"]["text"]
+            lines.append("\n" + "=" * 80)
+            lines.append("[AGENT TRACE] Reasoning Process:")
+            lines.append("-" * 80)
+            lines.append(str(reasoning_text))
+            lines.append("=" * 80)
+    
+    # Display rationale if available (all trace levels)
+    if "rationale" in orchestration and "text" in orchestration["rationale"]:
+        rationale_text = orchestration["rationale"]["text"]
+        lines.append("\n" + "=" * 80)
+        lines.append("[AGENT TRACE] Decision Rationale:")
+        lines.append("-" * 80)
+        lines.append(str(rationale_text))
+        lines.append("=" * 80)
+        
+    # Display invocation input if available (standard and detailed levels)
+    if trace_level in _INVOCATION_TRACE_LEVELS and "invocationInput" in orchestration:
+        invocation = orchestration["invocationInput"]
+        invocation_type = invocation.get("invocationType", "Unknown")
+        
+        lines.append("\n" + "-" * 80)
+        lines.append(f"[AGENT TRACE] Invocation Type: {invocation_type}")
+        
+        # Show action group invocation details
+        if "actionGroupInvocationInput" in invocation:
+            action_input = invocation["actionGroupInvocationInput"]
+            action_group = action_input.get("actionGroupName", "Unknown")
+            function = action_input.get("function", "Unknown")
+            parameters = action_input.get("parameters", [])
+            
+            lines.append(f"[AGENT TRACE] Action Group: {action_group}")
+            lines.append(f"[AGENT TRACE] Function: {function}")
+            if parameters:
+                lines.append("[AGENT TRACE] Parameters:")
+                for param in parameters:
+                    lines.append(f"  - {param.get('name')}: {param.get('value')} ({param.get('type', 'unknown')})")
+        lines.append("-" * 80)
+
+def _add_pre_processing_trace(trace: Dict[str, Any], trace_level: str, lines: List[str]) -> None:
+    """Add the pre-processing rationale to lines"""
+    if "preProcessingTrace" in trace and "modelInvocationOutput" in trace["preProcessingTrace"]:
+        pre_processing = trace["preProcessingTrace"]["modelInvocationOutput"]
+        if "parsedResponse" in pre_processing:
+            parsed = pre_processing["parsedResponse"]
+            if "rationale" in parsed:
+                lines.append("\n" + "-" * 80)
+                lines.append("[AGENT TRACE] Pre-processing Rationale:")
+                lines.append(str(parsed["rationale"]))
+                lines.append("-" * 80)
+
+def _add_post_processing_trace(trace: Dict[str, Any], trace_level: str, lines: List[str]) -> None:
+    """Add the post-processing reasoning to lines"""
+    if "postProcessingTrace" in trace and "modelInvocationOutput" in trace["postProcessingTrace"]:
+        post_processing = trace["postProcessingTrace"]["modelInvocationOutput"]
+        if "reasoningContent" in post_processing and "reasoningText" in post_processing["reasoningContent"]:
+            reasoning = post_processing["reasoningContent"]["reasoningText"]
+            if "text" in reasoning:
+                lines.append("\n" + "-" * 80)
+                lines.append("[AGENT TRACE] Post-processing Reasoning:")
+                lines.append(str(reasoning["text"]))
+                lines.append("-" * 80)
+
+# Trace sections displayed at each trace level. Pre- and post-processing traces
+# are only shown at the detailed level.
+_TRACE_HANDLERS = {
+    "minimal": (_add_orchestration_trace,),
+    "standard": (_add_orchestration_trace,),
+    "detailed": (_add_orchestration_trace, _add_pre_processing_trace, _add_post_processing_trace)
+}
+
+def process_trace_data(trace_data: Dict[str, Any], agent_traces: bool, trace_level: str, output: Optional[TextIO] = None) -> None:
     """
     Process and display trace information from the agent
     
+    The lines for a trace event are collected and written in one call, so
+    traces from concurrent runs don't interleave line by line.
+    
     Args:
         trace_data: The trace data from the agent response
         agent_traces: Whether agent traces are enabled
         trace_level: The trace level (none, minimal, standard, detailed, raw)
+        output: Stream to write the trace to (default: None, uses sys.stdout)
     """
     # Skip trace processing if agent_traces is disabled or trace level is none
     if not agent_traces or trace_level == "none":
@@ -20,84 +109,19 @@ def process_trace_data(trace_data: Dict[str, Any], agent_traces: bool, trace_lev
     if not trace_data or not isinstance(trace_data, dict) or "trace" not in trace_data:
         return
     
+    lines = []
+    
     # For raw trace level, dump the entire trace data without processing
     if trace_level == "raw":
-        print("\n" + "=" * 80)
-        print("[AGENT TRACE] RAW TRACE DATA:")
-        print("-" * 80)
-        print(json.dumps(trace_data, indent=2))
-        print("=" * 80)
-        return
-        
-    trace = trace_data["trace"]
+        lines.append("\n" + "=" * 80)
+        lines.append("[AGENT TRACE] RAW TRACE DATA:")
+        lines.append("-" * 80)
+        lines.append(json.dumps(trace_data, indent=2))
+        lines.append("=" * 80)
+    else:
+        trace = trace_data["trace"]
+        for handler in _TRACE_HANDLERS.get(trace_level, _TRACE_HANDLERS["minimal"]):
+            handler(trace, trace_level, lines)
     
-    # Process orchestration trace (main reasoning and decision making)
-    if "orchestrationTrace" in trace:
-        orchestration = trace["orchestrationTrace"]
-        
-        # Display model reasoning if available (all trace levels)
-        if "modelInvocationOutput" in orchestration and "reasoningContent" in orchestration["modelInvocationOutput"]:
-            reasoning = orchestration["modelInvocationOutput"]["reasoningContent"]
-            if "reasoningText" in reasoning and "text" in reasoning["reasoningText"]:
-                reasoning_text = reasoning["reasoningText"]["text"]
-                print("\n" + "=" * 80)
-                print("[AGENT TRACE] Reasoning Process:")
-                print("-" * 80)
-                print(reasoning_text)
-                print("=" * 80)
-        
-        # Display rationale if available (all trace levels)
-        if "rationale" in orchestration and "text" in orchestration["rationale"]:
-            rationale_text = orchestration["rationale"]["text"]
-            print("\n" + "=" * 80)
-            print("[AGENT TRACE] Decision Rationale:")
-            print("-" * 80)
-            print(rationale_text)
-            print("=" * 80)
-            
-        # Display invocation input if available (standard and detailed levels)
-        if trace_level in ["standard", "detailed"] and "invocationInput" in orchestration:
-            invocation = orchestration["invocationInput"]
-            invocation_type = invocation.get("invocationType", "Unknown")
-            
-            print("\n" + "-" * 80)
-            print(f"[AGENT TRACE] Invocation Type: {invocation_type}")
-            
-            # Show action group invocation details
-            if "actionGroupInvocationInput" in invocation:
-                action_input = invocation["actionGroupInvocationInput"]
-                action_group = action_input.get("actionGroupName", "Unknown")
-                function = action_input.get("function", "Unknown")
-                parameters = action_input.get("parameters", [])
-                
-                print(f"[AGENT TRACE] Action Group: {action_group}")
-                print(f"[AGENT TRACE] Function: {function}")
-                if parameters:
-                    print("[AGENT TRACE] Parameters:")
-                    for param in parameters:
-                        print(f"  - {param.get('name')}: {param.get('value')} ({param.get('type', 'unknown')})")
-            print("-" * 80)
-    
-    # Only process these traces for detailed level
-    if trace_level == "detailed":
-        # Process pre-processing trace
-        if "preProcessingTrace" in trace and "modelInvocationOutput" in trace["preProcessingTrace"]:
-            pre_processing = trace["preProcessingTrace"]["modelInvocationOutput"]
-            if "parsedResponse" in pre_processing:
-                parsed = pre_processing["parsedResponse"]
-                if "rationale" in parsed:
-                    print("\n" + "-" * 80)
-                    print("[AGENT TRACE] Pre-processing Rationale:")
-                    print(parsed["rationale"])
-                    print("-" * 80)
-        
-        # Process post-processing trace
-        if "postProcessingTrace" in trace and "modelInvocationOutput" in trace["postProcessingTrace"]:
-            post_processing = trace["postProcessingTrace"]["modelInvocationOutput"]
-            if "reasoningContent" in post_processing and "reasoningText" in post_processing["reasoningContent"]:
-                reasoning = post_processing["reasoningContent"]["reasoningText"]
-                if "text" in reasoning:
-                    print("\n" + "-" * 80)
-                    print("[AGENT TRACE] Post-processing Reasoning:")
-                    print(reasoning["text"])
-                    print("-" * 80) 
\ No newline at end of file
+    if lines:
+        (output or sys.stdout).write("\n".join(lines) + "\n")
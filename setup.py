@@ -27,6 +27,9 @@ setup(
         "PyYAML>=6.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "black",
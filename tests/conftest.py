@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import patch, MagicMock
+from bedrock_agents_sdk.core.client import _get_runtime_client
 
 # Sample functions for testing
 def sample_function() -> dict:
@@ -20,4 +21,11 @@ def mock_boto3_session():
     with patch("boto3.Session") as mock_session:
         mock_client = MagicMock()
         mock_session.return_value.client.return_value = mock_client
-        yield mock_session, mock_client 
\ No newline at end of file
+        yield mock_session, mock_client
+
+@pytest.fixture(autouse=True)
+def clear_runtime_client_cache():
+    """Make sure each test creates its own (mocked) runtime client"""
+    _get_runtime_client.cache_clear()
+    yield
+    _get_runtime_client.cache_clear()
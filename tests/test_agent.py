@@ -75,4 +75,33 @@ class TestAgent:
         agent.add_function(sample_function_with_params, action_group="ParamActions")
         assert len(agent.functions) == 2
         assert agent.functions[1].name == "sample_function_with_params"
-        assert agent.functions[1].action_group == "ParamActions" 
\ No newline at end of file
+        assert agent.functions[1].action_group == "ParamActions"
+    
+    def test_action_groups_sorted_by_name(self):
+        """Test that action groups and their functions are ordered by name"""
+        agent = Agent(
+            name="TestAgent",
+            model="us.anthropic.claude-3-5-sonnet-20241022-v2:0",
+            instructions="You are a test agent",
+            functions={
+                "ZetaActions": [sample_function_with_params, sample_function],
+                "AlphaActions": [sample_function_with_params]
+            }
+        )
+        
+        assert [ag.name for ag in agent.action_groups] == ["AlphaActions", "ZetaActions"]
+        assert [f.name for f in agent.action_groups[1].functions] == ["sample_function", "sample_function_with_params"]
+    
+    def test_function_map_kept_on_agent(self):
+        """Test that the agent maintains its function name to callable map"""
+        agent = Agent(
+            name="TestAgent",
+            model="us.anthropic.claude-3-5-sonnet-20241022-v2:0",
+            instructions="You are a test agent",
+            functions=[sample_function]
+        )
+        
+        assert agent._function_map_cache == {"sample_function": sample_function}
+        
+        agent.add_function(sample_function_with_params)
+        assert agent._function_map_cache["sample_function_with_params"] is sample_function_with_params
@@ -0,0 +1,69 @@
+import pytest
+from unittest.mock import MagicMock
+
+from bedrock_agents_sdk import Agent
+import app
+
+@pytest.fixture
+def agent():
+    """Create the example app's agent"""
+    return Agent(
+        name="HelperAgent",
+        model="us.anthropic.claude-3-5-sonnet-20241022-v2:0",
+        instructions=app._INSTRUCTIONS,
+        functions=app._FUNCTIONS,
+        enable_code_interpreter=True
+    )
+
+MESSAGES = [{"role": "user", "content": "What is in this file?"}]
+
+class TestCacheKey:
+    def test_cache_key_is_stable(self, agent):
+        """Test that the same agent and conversation give the same key"""
+        assert app._cache_key(agent, MESSAGES) == app._cache_key(agent, [dict(MESSAGES[0])])
+
+    def test_cache_key_includes_files(self, agent):
+        """Test that attached files, and their content, change the key"""
+        no_file = app._cache_key(agent, MESSAGES)
+
+        agent.add_file("data.csv", b"a,b\n1,2", "text/csv")
+        first = app._cache_key(agent, MESSAGES)
+
+        agent.files[0] = agent.files[0].model_copy(update={"content": b"a,b\n3,4"})
+        second = app._cache_key(agent, MESSAGES)
+
+        assert len({no_file, first, second}) == 3
+
+    def test_cache_key_includes_code_interpreter(self, agent):
+        """Test that the code interpreter setting changes the key"""
+        enabled = app._cache_key(agent, MESSAGES)
+        agent.enable_code_interpreter = False
+        assert app._cache_key(agent, MESSAGES) != enabled
+
+class TestRunCached:
+    def test_run_cached_replays_response(self, agent, tmp_path):
+        """Test that a repeated query is answered from the cache"""
+        client = MagicMock()
+        client.run.return_value = {"response": "It is a CSV file", "files": []}
+
+        first = app.run_cached(client, agent, MESSAGES, str(tmp_path))
+        second = app.run_cached(client, agent, MESSAGES, str(tmp_path))
+
+        assert client.run.call_count == 1
+        assert first["response"] == second["response"] == "It is a CSV file"
+
+    def test_run_cached_skips_responses_with_files(self, agent, tmp_path):
+        """Test that runs producing files are not cached"""
+        client = MagicMock()
+        client.run.return_value = {"response": "Here is a chart", "files": [MagicMock()]}
+
+        app.run_cached(client, agent, MESSAGES, str(tmp_path))
+        app.run_cached(client, agent, MESSAGES, str(tmp_path))
+
+        assert client.run.call_count == 2
+
+class TestMain:
+    def test_cache_with_several_queries_is_rejected(self):
+        """Test that --cache can't be combined with several queries"""
+        with pytest.raises(SystemExit):
+            app.main(["--cache", "--query", "one", "--query", "two"])
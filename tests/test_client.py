@@ -1,9 +1,17 @@
 import pytest
+import asyncio
 import json
+import os
+import tempfile
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock, call
-from bedrock_agents_sdk import BedrockAgents, Agent, Message, Function
+from bedrock_agents_sdk import BedrockAgents, Agent, Message, Function, ActionGroup
 from bedrock_agents_sdk.plugins.base import BedrockAgentsPlugin
+from bedrock_agents_sdk.core.client import _FUNCTION_FAILED, _ConfigKey
+from botocore.config import Config
+from botocore.exceptions import ClientError, NoCredentialsError
 
 # Sample functions for testing
 def sample_function() -> dict:
@@ -69,11 +77,17 @@ class TestBedrockAgents:
             max_tool_calls=5
         )
         
+        # The runtime client is created on first use
+        mock_session.assert_not_called()
+        assert client.bedrock_agent_runtime is mock_client
+        
         # Check that the session was created with the correct parameters
         mock_session.assert_called_once_with(region_name="us-west-2", profile_name="test-profile")
         
         # Check that the client was created
-        mock_session.return_value.client.assert_called_once_with("bedrock-agent-runtime")
+        mock_session.return_value.client.assert_called_once()
+        assert mock_session.return_value.client.call_args[0] == ("bedrock-agent-runtime",)
+        assert mock_session.return_value.client.call_args[1]["config"].max_pool_connections == 50
         
         # Check that the client properties were set correctly
         assert client.verbosity == "normal"
@@ -138,7 +152,29 @@ class TestBedrockAgents:
         
         # Execute a non-existent function
         result = client._execute_function(function_map, "non_existent_function", {})
-        assert result is None
+        assert result is _FUNCTION_FAILED
+        
+        # A function that returns an empty value has not failed
+        result = client._execute_function({"empty_function": lambda: []}, "empty_function", {})
+        assert result == []
+    
+    def test_execute_async_function(self, client):
+        """Test that async functions are awaited"""
+        async def async_function(value: str) -> dict:
+            return {"value": value}
+        
+        result = client._execute_function({"async_function": async_function}, "async_function", {"value": "test"})
+        assert result == {"value": "test"}
+    
+    def test_execute_async_function_with_running_loop(self, client):
+        """Test that async functions are awaited when called from a running event loop"""
+        async def async_function(value: str) -> dict:
+            return {"value": value}
+        
+        async def call_from_loop():
+            return client._execute_function({"async_function": async_function}, "async_function", {"value": "test"})
+        
+        assert asyncio.run(call_from_loop()) == {"value": "test"}
     
     def test_invoke_agent_basic(self, client, agent, mock_boto3_session):
         """Test that an agent can be invoked with a basic message"""
@@ -177,6 +213,30 @@ class TestBedrockAgents:
         assert result["response"] == "This is a test response"
         assert result["files"] == []
     
+    def test_invoke_agent_split_multibyte_chunks(self, client, agent, mock_boto3_session):
+        """Test that a character split across streamed chunks is decoded correctly"""
+        _, mock_client = mock_boto3_session
+        
+        encoded = "Café ☕".encode("utf-8")
+        mock_client.invoke_inline_agent.return_value = {
+            "completion": [
+                {"chunk": {"bytes": encoded[:4]}},
+                {"chunk": {"bytes": encoded[4:7]}},
+                {"chunk": {"bytes": encoded[7:]}}
+            ]
+        }
+        
+        result = client._invoke_agent(
+            agent=agent,
+            action_groups=[],
+            function_map={},
+            session_id="test-session",
+            input_text="Hello, agent!",
+            tool_call_count=0
+        )
+        
+        assert result["response"] == "Café ☕"
+    
     def test_invoke_agent_with_function_call(self, client, agent, mock_boto3_session):
         """Test that an agent can invoke a function"""
         _, mock_client = mock_boto3_session
@@ -239,6 +299,52 @@ class TestBedrockAgents:
         assert result["response"] == "Let me check that for you.\nThe function returned success."
         assert result["files"] == []
     
+    def test_invoke_agent_streams_text(self, client, agent, mock_boto3_session):
+        """Test that response text is passed to on_text as it arrives"""
+        _, mock_client = mock_boto3_session
+        
+        mock_client.invoke_inline_agent.side_effect = [
+            {
+                "completion": [
+                    {"chunk": {"bytes": b"Let me check "}},
+                    {"chunk": {"bytes": b"that for you."}},
+                    {
+                        "returnControl": {
+                            "invocationId": "test-invocation",
+                            "invocationInputs": [
+                                {
+                                    "functionInvocationInput": {
+                                        "function": "sample_function",
+                                        "actionGroup": "DefaultActions",
+                                        "parameters": []
+                                    }
+                                }
+                            ]
+                        }
+                    }
+                ]
+            },
+            {
+                "completion": [
+                    {"chunk": {"bytes": b"The function returned success."}}
+                ]
+            }
+        ]
+        
+        streamed = []
+        result = client._invoke_agent(
+            agent=agent,
+            action_groups=[],
+            function_map={"sample_function": sample_function},
+            session_id="test-session",
+            input_text="Call the sample function",
+            tool_call_count=0,
+            on_text=streamed.append
+        )
+        
+        assert streamed == ["Let me check ", "that for you.", "\nThe function returned success."]
+        assert "".join(streamed) == result["response"]
+    
     def test_agent_plugins_integration(self, client, mock_boto3_session):
         """Test that agent plugins are applied during invocation"""
         _, mock_client = mock_boto3_session
@@ -275,4 +381,481 @@ class TestBedrockAgents:
         
         # Check that post_process was called
         assert "agent_post_process" in result
-        assert result["agent_post_process"] is True 
\ No newline at end of file
+        assert result["agent_post_process"] is True
+    
+    def test_agent_plugins_modify_in_place(self, client, mock_boto3_session):
+        """Test that plugin hooks can modify their argument in place and return None"""
+        _, mock_client = mock_boto3_session
+        mock_client.invoke_inline_agent.return_value = {
+            "completion": [{"chunk": {"bytes": b"This is a test response"}}]
+        }
+        
+        class InPlacePlugin(BedrockAgentsPlugin):
+            def pre_invoke(self, params):
+                params["in_place"] = True
+            
+            def post_process(self, result):
+                result["in_place"] = True
+        
+        agent = Agent(
+            name="TestAgent",
+            model="us.anthropic.claude-3-5-sonnet-20241022-v2:0",
+            instructions="You are a test agent",
+            plugins=[InPlacePlugin(), TestAgentPlugin()]
+        )
+        
+        result = client.run(agent=agent, message="Test message")
+        
+        invoke_args = mock_client.invoke_inline_agent.call_args[1]
+        assert invoke_args["in_place"] is True
+        assert invoke_args["agent_plugin"] is True
+        assert result["response"] == "This is a test response"
+        assert result["in_place"] is True
+    
+    def test_agent_plugins_modifying_action_groups_do_not_change_cache(self, client, mock_boto3_session):
+        """Test that a plugin editing the action groups in place doesn't affect later runs"""
+        _, mock_client = mock_boto3_session
+        mock_client.invoke_inline_agent.return_value = {
+            "completion": [{"chunk": {"bytes": b"This is a test response"}}]
+        }
+        
+        class ActionGroupPlugin(BedrockAgentsPlugin):
+            def pre_invoke(self, params):
+                params["actionGroups"][0]["functionSchema"]["functions"][0]["description"] += " (edited)"
+                params["actionGroups"].append({"actionGroupName": "PluginActions"})
+        
+        agent = Agent(
+            name="TestAgent",
+            model="us.anthropic.claude-3-5-sonnet-20241022-v2:0",
+            instructions="You are a test agent",
+            functions=[sample_function],
+            plugins=[ActionGroupPlugin()]
+        )
+        
+        for _ in range(2):
+            client.run(agent=agent, message="Test message")
+            action_groups = mock_client.invoke_inline_agent.call_args[1]["actionGroups"]
+            assert [ag["actionGroupName"] for ag in action_groups] == ["DefaultActions", "PluginActions"]
+            assert action_groups[0]["functionSchema"]["functions"][0]["description"].count("(edited)") == 1
+        
+        assert agent.functions[0].to_dict()["description"] == "A sample function that returns a dictionary"
+    
+    def test_chat_streams_response(self, client, agent, mock_boto3_session, capsys):
+        """Test that chat prints the response as it arrives when streaming"""
+        _, mock_client = mock_boto3_session
+        mock_client.invoke_inline_agent.return_value = {
+            "completion": [
+                {"chunk": {"bytes": b"This is a "}},
+                {"chunk": {"bytes": b"test response"}}
+            ]
+        }
+        
+        with patch("builtins.input", side_effect=["Hello", "exit"]), \
+                patch.object(client, "_invoke_agent", wraps=client._invoke_agent) as invoke:
+            client.chat(agent=agent, stream=True)
+        
+        assert invoke.call_args[1]["on_text"] is not None
+        assert "Assistant: This is a test response\n" in capsys.readouterr().out
+    
+    def test_chat_does_not_stream_by_default(self, client, agent, mock_boto3_session, capsys):
+        """Test that chat prints the complete response unless streaming is requested"""
+        _, mock_client = mock_boto3_session
+        mock_client.invoke_inline_agent.return_value = {
+            "completion": [{"chunk": {"bytes": b"This is a test response"}}]
+        }
+        
+        with patch("builtins.input", side_effect=["Hello", "exit"]), \
+                patch.object(client, "_invoke_agent", wraps=client._invoke_agent) as invoke:
+            client.chat(agent=agent)
+        
+        assert invoke.call_args[1]["on_text"] is None
+        assert "Assistant: This is a test response\n" in capsys.readouterr().out
+    
+    def test_chat_does_not_stream_with_post_process_plugin(self, client, mock_boto3_session, capsys):
+        """Test that chat shows the post-processed response when a plugin has a post_process hook"""
+        _, mock_client = mock_boto3_session
+        mock_client.invoke_inline_agent.return_value = {
+            "completion": [{"chunk": {"bytes": b"My password is hunter2"}}]
+        }
+        
+        class RedactingPlugin(BedrockAgentsPlugin):
+            def post_process(self, result):
+                result["response"] = result["response"].replace("hunter2", "[REDACTED]")
+                return result
+        
+        agent = Agent(
+            name="TestAgent",
+            model="us.anthropic.claude-3-5-sonnet-20241022-v2:0",
+            instructions="You are a test agent",
+            plugins=[RedactingPlugin()]
+        )
+        
+        with patch("builtins.input", side_effect=["Hello", "exit"]):
+            client.chat(agent=agent, stream=True)
+        
+        output = capsys.readouterr().out
+        assert "Assistant: My password is [REDACTED]" in output
+        assert "hunter2" not in output
+    
+    def test_performance_config(self, mock_boto3_session):
+        """Test that the performance configuration is sent with the invocation"""
+        _, mock_client = mock_boto3_session
+        
+        mock_client.invoke_inline_agent.return_value = {
+            "completion": [{"chunk": {"bytes": b"Done"}}]
+        }
+        
+        client = BedrockAgents(verbosity="quiet", performance_config={"latency": "optimized"})
+        agent = Agent(
+            name="TestAgent",
+            model="us.anthropic.claude-3-5-haiku-20241022-v1:0",
+            instructions="You are a test agent",
+            functions=[sample_function]
+        )
+        
+        client.run(agent=agent, message="Test message")
+        
+        invoke_args = mock_client.invoke_inline_agent.call_args[1]
+        assert invoke_args["bedrockModelConfigurations"] == {
+            "performanceConfig": {"latency": "optimized"}
+        }
+    
+    def test_performance_config_validation(self, mock_boto3_session):
+        """Test that a latency string is accepted and unknown values are rejected"""
+        client = BedrockAgents(verbosity="quiet", performance_config="optimized")
+        assert client.performance_config == {"latency": "optimized"}
+        
+        with pytest.raises(ValueError):
+            BedrockAgents(verbosity="quiet", performance_config="fast")
+    
+    def test_agent_latency_optimized(self, client, mock_boto3_session):
+        """Test that an agent can opt in to latency-optimized inference"""
+        _, mock_client = mock_boto3_session
+        
+        mock_client.invoke_inline_agent.return_value = {
+            "completion": [{"chunk": {"bytes": b"Done"}}]
+        }
+        
+        agent = Agent(
+            name="TestAgent",
+            model="us.anthropic.claude-3-5-haiku-20241022-v1:0",
+            instructions="You are a test agent",
+            functions=[sample_function],
+            latency_optimized=True
+        )
+        
+        client.run(agent=agent, message="Test message")
+        
+        invoke_args = mock_client.invoke_inline_agent.call_args[1]
+        assert invoke_args["bedrockModelConfigurations"] == {
+            "performanceConfig": {"latency": "optimized"}
+        }
+    
+    def test_run_batch(self, client, agent, mock_boto3_session):
+        """Test that several conversations can be run as a batch"""
+        _, mock_client = mock_boto3_session
+        
+        def invoke(**params):
+            return {
+                "completion": [{"chunk": {"bytes": f"Echo: {params['inputText']}".encode("utf-8")}}]
+            }
+        mock_client.invoke_inline_agent.side_effect = invoke
+        
+        results = client.run_batch(
+            agent=agent,
+            message_lists=[
+                [{"role": "user", "content": "first"}],
+                [Message(role="user", content="second")],
+                [{"role": "user", "content": "third"}]
+            ],
+            max_workers=2
+        )
+        
+        assert [r["response"] for r in results] == ["Echo: first", "Echo: second", "Echo: third"]
+        
+        # Each conversation runs in its own session
+        session_ids = {c[1]["sessionId"] for c in mock_client.invoke_inline_agent.call_args_list}
+        assert len(session_ids) == 3
+    
+    def test_arun(self, client, agent, mock_boto3_session):
+        """Test that runs can be awaited concurrently from async code"""
+        _, mock_client = mock_boto3_session
+        mock_client.invoke_inline_agent.side_effect = lambda **params: {
+            "completion": [{"chunk": {"bytes": f"Echo: {params['inputText']}".encode("utf-8")}}]
+        }
+        
+        async def run_both():
+            return await asyncio.gather(
+                client.arun(agent=agent, message="first"),
+                client.arun(agent=agent, message="second")
+            )
+        
+        results = asyncio.run(run_both())
+        assert [r["response"] for r in results] == ["Echo: first", "Echo: second"]
+    
+    def test_arun_batch(self, client, agent, mock_boto3_session):
+        """Test that conversations run from async code keep their order"""
+        _, mock_client = mock_boto3_session
+        mock_client.invoke_inline_agent.side_effect = lambda **params: {
+            "completion": [{"chunk": {"bytes": f"Echo: {params['inputText']}".encode("utf-8")}}]
+        }
+        
+        message_lists = [[{"role": "user", "content": f"Question {i}"}] for i in range(5)]
+        results = asyncio.run(client.arun_batch(agent=agent, message_lists=message_lists, max_concurrency=2))
+        
+        assert [r["response"] for r in results] == [f"Echo: Question {i}" for i in range(5)]
+        assert asyncio.run(client.arun_batch(agent=agent, message_lists=[])) == []
+    
+    def test_invoke_agent_with_multiple_function_calls(self, client, agent, mock_boto3_session):
+        """Test that all function calls in one return control event are executed and returned together"""
+        _, mock_client = mock_boto3_session
+        
+        mock_client.invoke_inline_agent.side_effect = [
+            {
+                "completion": [
+                    {
+                        "returnControl": {
+                            "invocationId": "test-invocation",
+                            "invocationInputs": [
+                                {
+                                    "functionInvocationInput": {
+                                        "function": "sample_function_with_params",
+                                        "actionGroup": "DefaultActions",
+                                        "parameters": [
+                                            {"name": "param1", "type": "string", "value": "first"}
+                                        ]
+                                    }
+                                },
+                                {
+                                    "functionInvocationInput": {
+                                        "function": "sample_function",
+                                        "actionGroup": "DefaultActions",
+                                        "parameters": []
+                                    }
+                                }
+                            ]
+                        }
+                    }
+                ]
+            },
+            {
+                "completion": [{"chunk": {"bytes": b"Both functions returned."}}]
+            }
+        ]
+        
+        function_map = {
+            "sample_function": sample_function,
+            "sample_function_with_params": sample_function_with_params
+        }
+        
+        result = client._invoke_agent(
+            agent=agent,
+            action_groups=[],
+            function_map=function_map,
+            session_id="test-session",
+            input_text="Call both functions",
+            tool_call_count=0
+        )
+        
+        assert mock_client.invoke_inline_agent.call_count == 2
+        assert result["response"] == "Both functions returned."
+        
+        # Both results are sent back in a single follow-up call, in request order
+        follow_up = mock_client.invoke_inline_agent.call_args_list[1][1]
+        results = follow_up["inlineSessionState"]["returnControlInvocationResults"]
+        assert [r["functionResult"]["function"] for r in results] == ["sample_function_with_params", "sample_function"]
+        assert json.loads(results[0]["functionResult"]["responseBody"]["application/json"]["body"]) == {"param1": "first", "param2": 123}
+        assert json.loads(results[1]["functionResult"]["responseBody"]["application/json"]["body"]) == {"status": "success"}
+    
+    def test_tool_executor_shared(self, client):
+        """Test that the tool thread pool is created lazily and reused"""
+        assert client._tool_executor is None
+        
+        function_map = {"sample_function": sample_function}
+        function_inputs = [{"function": "sample_function", "parameters": []}] * 2
+        
+        assert client._execute_function_calls(function_map, function_inputs) == [{"status": "success"}] * 2
+        executor = client._tool_executor
+        assert executor is not None
+        
+        client._execute_function_calls(function_map, function_inputs)
+        assert client._tool_executor is executor
+    
+    def test_sequential_tool_calls(self, client):
+        """Test that function calls run in order on the calling thread when parallel is off"""
+        calls = []
+        
+        def record(name: str) -> dict:
+            calls.append((name, threading.current_thread()))
+            return {"name": name}
+        
+        function_inputs = [
+            {"function": "record", "parameters": [{"name": "name", "type": "string", "value": value}]}
+            for value in ("first", "second")
+        ]
+        results = client._execute_function_calls({"record": record}, function_inputs, parallel=False)
+        
+        assert results == [{"name": "first"}, {"name": "second"}]
+        assert calls == [("first", threading.current_thread()), ("second", threading.current_thread())]
+        assert client._tool_executor is None
+    
+    def test_prewarm(self, mock_boto3_session, capsys):
+        """Test that prewarm issues a request, tolerates errors and only reports success"""
+        _, mock_client = mock_boto3_session
+        client = BedrockAgents(verbosity="normal")
+        capsys.readouterr()
+        
+        client.prewarm()
+        mock_client.list_sessions.assert_called_once_with(maxResults=1)
+        assert "is ready" in capsys.readouterr().out
+        
+        mock_client.list_sessions.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException", "Message": "Denied"}}, "ListSessions"
+        )
+        client.prewarm()
+        assert "is ready" not in capsys.readouterr().out
+        
+        mock_client.list_sessions.side_effect = NoCredentialsError()
+        client.prewarm()
+        assert "is ready" not in capsys.readouterr().out
+    
+    def test_run_save_all_files(self, client, agent, mock_boto3_session):
+        """Test that files returned by the agent can be saved to a new directory"""
+        _, mock_client = mock_boto3_session
+        
+        mock_client.invoke_inline_agent.return_value = {
+            "completion": [
+                {"chunk": {"bytes": b"Here are your files"}},
+                {
+                    "files": {
+                        "files": [
+                            {"name": "a.txt", "bytes": b"first", "type": "text/plain"},
+                            {"name": "b.txt", "bytes": b"second", "type": "text/plain"}
+                        ]
+                    }
+                }
+            ]
+        }
+        
+        result = client.run(agent=agent, message="Make some files")
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            save_dir = os.path.join(temp_dir, "output")
+            saved_paths = result["save_all_files"](save_dir)
+            
+            assert saved_paths == [os.path.join(save_dir, "a.txt"), os.path.join(save_dir, "b.txt")]
+            with open(saved_paths[1], "rb") as f:
+                assert f.read() == b"second"
+    
+    def test_action_groups_cached_per_agent(self, client, agent, mock_boto3_session):
+        """Test that action groups are built once per agent and rebuilt after adding a function"""
+        _, mock_client = mock_boto3_session
+        
+        mock_client.invoke_inline_agent.return_value = {
+            "completion": [{"chunk": {"bytes": b"Done"}}]
+        }
+        
+        with patch.object(client, "_build_action_groups", wraps=client._build_action_groups) as build:
+            client.run(agent=agent, message="First")
+            client.run(agent=agent, message="Second")
+            assert build.call_count == 1
+            
+            agent.add_function(lambda: {"status": "new"}, description="A new function")
+            client.run(agent=agent, message="Third")
+            assert build.call_count == 2
+            
+            agent.enable_code_interpreter = True
+            client.run(agent=agent, message="Fourth")
+            assert build.call_count == 3
+        
+        action_groups = mock_client.invoke_inline_agent.call_args[1]["actionGroups"]
+        assert len(action_groups[0]["functionSchema"]["functions"]) == 3
+        assert action_groups[-1]["actionGroupName"] == "CodeInterpreterAction"
+    
+    def test_action_groups_rebuilt_after_direct_edits(self, client, agent, mock_boto3_session):
+        """Test that functions and action groups changed directly on the agent are picked up"""
+        _, mock_client = mock_boto3_session
+        
+        mock_client.invoke_inline_agent.return_value = {
+            "completion": [{"chunk": {"bytes": b"Done"}}]
+        }
+        
+        client.run(agent=agent, message="First")
+        
+        def new_function() -> dict:
+            """A function appended to the list directly"""
+            return {"status": "new"}
+        
+        agent.functions.append(Function(name="new_function", description="A new function", function=new_function))
+        action_groups, function_map = client._prepare_agent(agent)
+        assert "new_function" in [f["name"] for f in action_groups[0]["functionSchema"]["functions"]]
+        assert function_map["new_function"] is new_function
+        
+        agent.action_groups = [ActionGroup(name="ReplacedActions", description="Replaced", functions=[new_function])]
+        action_groups, _ = client._prepare_agent(agent)
+        assert [ag["actionGroupName"] for ag in action_groups] == ["ReplacedActions"]
+        
+        agent.action_groups[0].description = "Changed"
+        action_groups, _ = client._prepare_agent(agent)
+        assert action_groups[0]["description"] == "Changed"
+        
+        agent.functions[0].description = "Changed function"
+        agent.action_groups = []
+        action_groups, _ = client._prepare_agent(agent)
+        assert action_groups[0]["functionSchema"]["functions"][0]["description"] == "Changed function"
+    
+    def test_runtime_client_shared(self, mock_boto3_session):
+        """Test that clients with the same settings share one runtime client"""
+        mock_session, mock_client = mock_boto3_session
+        
+        first = BedrockAgents(region_name="us-west-2", verbosity="quiet")
+        second = BedrockAgents(region_name="us-west-2", verbosity="quiet")
+        
+        assert first.bedrock_agent_runtime is second.bedrock_agent_runtime
+        mock_session.assert_called_once_with(region_name="us-west-2", profile_name=None)
+        
+        BedrockAgents(region_name="us-east-1", verbosity="quiet").bedrock_agent_runtime
+        assert mock_session.call_count == 2
+    
+    def test_runtime_client_created_once_concurrently(self, mock_boto3_session):
+        """Test that concurrent first uses of the runtime client create it once"""
+        mock_session, _ = mock_boto3_session
+        clients = [BedrockAgents(verbosity="quiet") for _ in range(8)]
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            runtimes = list(executor.map(lambda c: c.bedrock_agent_runtime, clients))
+        
+        assert all(runtime is runtimes[0] for runtime in runtimes)
+        mock_session.assert_called_once()
+    
+    def test_boto_config_override(self, mock_boto3_session):
+        """Test that a custom botocore config is merged over the defaults"""
+        mock_session, _ = mock_boto3_session
+        
+        BedrockAgents(verbosity="quiet", boto_config=Config(read_timeout=300)).bedrock_agent_runtime
+        
+        config = mock_session.return_value.client.call_args[1]["config"]
+        assert config.read_timeout == 300
+        assert config.max_pool_connections == 50
+    
+    def test_equal_boto_configs_share_runtime_client(self, mock_boto3_session):
+        """Test that clients with equal, separately created configs share a runtime client"""
+        mock_session, _ = mock_boto3_session
+        
+        first = BedrockAgents(verbosity="quiet", boto_config=Config(read_timeout=300, retries={"mode": "standard"}))
+        second = BedrockAgents(verbosity="quiet", boto_config=Config(read_timeout=300, retries={"mode": "standard"}))
+        other = BedrockAgents(verbosity="quiet", boto_config=Config(read_timeout=60))
+        
+        assert first.bedrock_agent_runtime is second.bedrock_agent_runtime
+        other.bedrock_agent_runtime
+        assert mock_session.call_count == 2
+    
+    def test_boto_config_key_without_options(self):
+        """Test that configs whose options can't be read are keyed by identity"""
+        first = MagicMock(spec=[])
+        second = MagicMock(spec=[])
+        
+        assert _ConfigKey(first) == _ConfigKey(first)
+        assert hash(_ConfigKey(first)) == hash(_ConfigKey(first))
+        assert _ConfigKey(first) != _ConfigKey(second)
+        assert _ConfigKey(Config(read_timeout=300)) == _ConfigKey(Config(read_timeout=300))
@@ -62,4 +62,34 @@ class TestFunction:
         )
         
         result = func.function(param1="test", param2=456)
-        assert result == {"param1": "test", "param2": 456} 
\ No newline at end of file
+        assert result == {"param1": "test", "param2": 456}
+    
+    def test_function_to_dict(self):
+        """Test that a function converts to a function definition, built once"""
+        func = Function(
+            name="sample_function_with_params",
+            description="A sample function with parameters",
+            function=sample_function_with_params
+        )
+        
+        function_def = func.to_dict()
+        assert function_def["name"] == "sample_function_with_params"
+        assert function_def["requireConfirmation"] == "DISABLED"
+        assert function_def["parameters"]["param1"] == {"description": "A string parameter", "required": True, "type": "string"}
+        assert function_def["parameters"]["param2"]["required"] is False
+        assert func.to_dict() is function_def
+        
+        # Functions without parameters have no parameters key
+        func = Function(name="sample_function", description="A sample function", function=sample_function)
+        assert "parameters" not in func.to_dict()
+    
+    def test_function_to_dict_rebuilt_after_edit(self):
+        """Test that the function definition follows edits to the function"""
+        func = Function(name="sample_function", description="A sample function", function=sample_function)
+        assert func.to_dict()["description"] == "A sample function"
+        
+        func.description = "New description"
+        assert func.to_dict()["description"] == "New description"
+        
+        func.function = sample_function_with_params
+        assert "param1" in func.to_dict()["parameters"]
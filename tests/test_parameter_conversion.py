@@ -83,4 +83,34 @@ class TestParameterConversion:
         result = convert_parameters(parameters)
         
         # The invalid number should be skipped
-        assert result == {} 
\ No newline at end of file
+        assert result == {}
+    
+    def test_convert_array_parameters(self):
+        """Test converting array parameters"""
+        parameters = [
+            {"name": "names", "value": '["a", "b"]', "type": "array"},
+            {"name": "invalid_array", "value": "a, b", "type": "array"},
+            {"name": "number_array", "value": "5", "type": "array"},
+            {"name": "string_array", "value": '"x"', "type": "array"}
+        ]
+        
+        result = convert_parameters(parameters)
+        
+        assert result == {
+            "names": ["a", "b"],
+            "invalid_array": "a, b",
+            "number_array": "5",
+            "string_array": '"x"'
+        }
+    
+    def test_convert_typed_values_unchanged(self):
+        """Test that values which are not strings are passed through"""
+        parameters = [
+            {"name": "count", "value": 3, "type": "number"},
+            {"name": "enabled", "value": True, "type": "boolean"},
+            {"name": "missing", "value": None, "type": "number"}
+        ]
+        
+        result = convert_parameters(parameters)
+        
+        assert result == {"count": 3, "enabled": True, "missing": None}
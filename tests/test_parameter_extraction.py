@@ -1,4 +1,5 @@
 import pytest
+from typing import List, Optional
 from bedrock_agents_sdk.utils.parameter_extraction import extract_parameter_info
 
 # Sample functions for testing
@@ -21,6 +22,10 @@ def function_with_bool_param(enable: bool = False):
     """
     return {"enable": enable}
 
+def function_with_typed_params(count: Optional[int] = None, names: List[str] = None, note: Optional[str] = None):
+    """A function with optional and generic parameters"""
+    return {"count": count, "names": names, "note": note}
+
 def function_with_no_docstring(param1: str, param2: int = 123):
     return {"param1": param1, "param2": param2}
 
@@ -67,4 +72,22 @@ class TestParameterExtraction:
         
         assert params["param2"]["type"] == "number"
         assert params["param2"]["required"] == False
-        assert params["param2"]["description"] == "The param2 parameter" 
\ No newline at end of file
+        assert params["param2"]["description"] == "The param2 parameter"
+    
+    def test_extract_returns_independent_copies(self):
+        """Test that results are not shared between callers"""
+        params = extract_parameter_info(function_with_params)
+        params["param1"]["description"] = "Modified"
+        del params["param2"]
+        
+        params = extract_parameter_info(function_with_params)
+        assert params["param1"]["description"] == "A string parameter"
+        assert "param2" in params
+    
+    def test_extract_optional_and_generic_types(self):
+        """Test that Optional and generic annotations map to the underlying type"""
+        params = extract_parameter_info(function_with_typed_params)
+        
+        assert params["count"]["type"] == "number"
+        assert params["names"]["type"] == "array"
+        assert params["note"]["type"] == "string"
@@ -0,0 +1,14 @@
+import json
+from bedrock_agents_sdk.utils.serialization import serialize_result
+
+class TestSerialization:
+    def test_serialize_dict(self):
+        """Test that dictionaries are JSON encoded"""
+        result = {"status": "success", "count": 3, "items": [1.5, None, True]}
+        
+        assert json.loads(serialize_result(result)) == result
+    
+    def test_serialize_string(self):
+        """Test that string and bytes results are JSON encoded as strings"""
+        assert serialize_result("already text") == '"already text"'
+        assert serialize_result(b"raw bytes") == '"raw bytes"'
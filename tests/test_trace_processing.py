@@ -0,0 +1,62 @@
+import io
+import pytest
+from bedrock_agents_sdk.utils.trace_processing import process_trace_data
+
+# Sample trace event with orchestration and post-processing sections
+TRACE_DATA = {
+    "trace": {
+        "orchestrationTrace": {
+            "rationale": {"text": "I should check the time"},
+            "invocationInput": {
+                "invocationType": "ACTION_GROUP",
+                "actionGroupInvocationInput": {
+                    "actionGroupName": "TimeActions",
+                    "function": "get_time",
+                    "parameters": []
+                }
+            }
+        },
+        "postProcessingTrace": {
+            "modelInvocationOutput": {
+                "reasoningContent": {"reasoningText": {"text": "Summarising the answer"}}
+            }
+        }
+    }
+}
+
+class TestTraceProcessing:
+    def test_traces_disabled(self, capsys):
+        """Test that nothing is displayed when traces are off"""
+        process_trace_data(TRACE_DATA, agent_traces=False, trace_level="detailed")
+        process_trace_data(TRACE_DATA, agent_traces=True, trace_level="none")
+        
+        assert capsys.readouterr().out == ""
+    
+    def test_minimal_trace(self, capsys):
+        """Test that the minimal level only shows reasoning and rationale"""
+        process_trace_data(TRACE_DATA, agent_traces=True, trace_level="minimal")
+        
+        output = capsys.readouterr().out
+        assert "I should check the time" in output
+        assert "Invocation Type" not in output
+        assert "Post-processing Reasoning" not in output
+    
+    def test_detailed_trace(self, capsys):
+        """Test that the detailed level shows invocations and post-processing"""
+        process_trace_data(TRACE_DATA, agent_traces=True, trace_level="detailed")
+        
+        output = capsys.readouterr().out
+        assert "[AGENT TRACE] Function: get_time" in output
+        assert "Summarising the answer" in output
+    
+    def test_trace_written_to_output(self, capsys):
+        """Test that a trace event is written to the given stream in one call"""
+        output = io.StringIO()
+        with pytest.MonkeyPatch.context() as mp:
+            writes = []
+            mp.setattr(output, "write", lambda text: writes.append(text))
+            process_trace_data(TRACE_DATA, agent_traces=True, trace_level="standard", output=output)
+        
+        assert len(writes) == 1
+        assert "[AGENT TRACE] Decision Rationale:" in writes[0]
+        assert capsys.readouterr().out == ""